@@ -36,9 +36,11 @@ import sys
 import argparse
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 import signal
-import atexit
+import threading
+import weakref
 
 # Third-party imports
 import click
@@ -74,18 +76,33 @@ APP_DESCRIPTION = "[PROJECT_DESCRIPTION]"
 DEFAULT_CONFIG_PATH = "config/settings.yaml"
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_LOG_FILE = "logs/application.log"
+DEFAULT_MIN_PYTHON = (3, 8)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Environment settings
 ENV_PREFIX = "IOE_"
 DEBUG_MODE = os.getenv(f"{ENV_PREFIX}DEBUG", "false").lower() == "true"
 
+# Application metadata that is constant for the interpreter lifetime
+_STATIC_APP_INFO = MappingProxyType({
+    "name": APP_NAME,
+    "version": APP_VERSION,
+    "description": APP_DESCRIPTION,
+    "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+    "platform": sys.platform,
+    "config_path": DEFAULT_CONFIG_PATH
+})
+
 #######################################################################################################################
 # Global Variables
 #######################################################################################################################
 console = Console()
 logger: Optional[logging.Logger] = None
 app_config: Optional[Dict[str, Any]] = None
-running_modules: List[Any] = []
+running_modules: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_banner_cache: Dict[Any, str] = {}
 
 #######################################################################################################################
 # Application Classes
@@ -103,6 +120,7 @@ class IOEApplication:
         logger: Logger instance for application events
         modules: Dictionary of initialized application modules
         is_running: Application running status
+        _stop_event: Event set by the signal handler to stop the run loop
         
     Example:
         >>> app = IOEApplication()
@@ -110,6 +128,10 @@ class IOEApplication:
         >>> app.run()
     """
     
+    # Signal handlers are process-wide: install once, dispatch to the newest app
+    _signal_installed: bool = False
+    _active_instance: Optional["weakref.ref[IOEApplication]"] = None
+    
     def __init__(self, config_path: Optional[str] = None) -> None:
         """
         Initialize IOE application.
@@ -126,11 +148,15 @@ class IOEApplication:
         self.modules: Dict[str, Any] = {}
         self.is_running = False
         self.is_initialized = False
-        
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        atexit.register(self._cleanup_on_exit)
+        self._stop_event = threading.Event()
+        self._shutdown_done = False
+        
+        # Setup signal handlers for graceful shutdown; run() owns the cleanup
+        IOEApplication._active_instance = weakref.ref(self)
+        if not IOEApplication._signal_installed:
+            signal.signal(signal.SIGINT, IOEApplication._dispatch_signal)
+            signal.signal(signal.SIGTERM, IOEApplication._dispatch_signal)
+            IOEApplication._signal_installed = True
     
     def initialize(self) -> None:
         """
@@ -212,11 +238,11 @@ class IOEApplication:
     def _load_configuration(self) -> None:
         """Load application configuration from file or environment."""
         try:
-            # Try loading from file
-            if Path(self.config_path).exists():
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f) or {}
-            else:
+            # Try loading from file; binary mode lets libyaml decode UTF-8 itself
+            try:
+                with open(self.config_path, 'rb') as f:
+                    self.config = yaml.load(f, Loader=YAML_LOADER) or {}
+            except FileNotFoundError:
                 self.config = {}
             
             # Override with environment variables
@@ -320,8 +346,15 @@ class IOEApplication:
                 self.logger.debug(f"Initializing module: {module_name}")
                 # Add module-specific initialization logic
                 
-            global running_modules
-            running_modules = list(self.modules.values())
+            # Weak references only: modules are owned by the application. Plain values
+            # (dicts, strings, None, ...) cannot be weakly referenced and have no
+            # health_check, so they are left out of running_modules
+            running_modules.clear()
+            for module in self.modules.values():
+                try:
+                    running_modules.add(module)
+                except TypeError:
+                    pass
             
         except Exception as e:
             raise Exception(f"Module initialization failed: {e}")
@@ -330,11 +363,14 @@ class IOEApplication:
         """Validate system requirements and dependencies."""
         requirements = self.config.get('requirements', {})
         
-        # Check Python version
-        min_python = requirements.get('python_version', '3.8')
-        current_python = f"{sys.version_info.major}.{sys.version_info.minor}"
-        if current_python < min_python:
-            raise Exception(f"Python {min_python}+ required, found {current_python}")
+        # Check Python version (compare as integer tuples, not strings: "3.10" < "3.8")
+        min_python = requirements.get('python_version')
+        min_tuple = (tuple(int(part) for part in str(min_python).split('.'))
+                     if min_python else DEFAULT_MIN_PYTHON)
+        if sys.version_info[:len(min_tuple)] < min_tuple:
+            required = '.'.join(map(str, min_tuple))
+            found = f"{sys.version_info.major}.{sys.version_info.minor}"
+            raise Exception(f"Python {required}+ required, found {found}")
         
         # Check required files/directories
         required_paths = requirements.get('paths', [])
@@ -387,11 +423,19 @@ class IOEApplication:
             console.print("🔄 Running default application logic...")
             
             # Placeholder for application-specific logic
-            import time
-            for i in range(5):
-                self.logger.info(f"Application running... step {i+1}/5")
-                console.print(f"  Step {i+1}/5: Processing...", style="cyan")
-                time.sleep(1)
+            # Progress redraws on its own cadence instead of one print per step;
+            # Event.wait returns as soon as a signal requests shutdown
+            total_steps = 5
+            log_steps = self.logger.isEnabledFor(logging.INFO)
+            with Progress(console=console, transient=True) as progress:
+                task = progress.add_task("Processing...", total=total_steps)
+                for i in range(total_steps):
+                    if log_steps:
+                        self.logger.info("Application running... step %d/%d", i + 1, total_steps)
+                    if self._stop_event.wait(1.0):
+                        console.print("⏹️ Stop requested, leaving application loop", style="yellow")
+                        return 0
+                    progress.advance(task)
             
             console.print("✅ Application execution completed successfully!", style="bold green")
             return 0
@@ -401,6 +445,25 @@ class IOEApplication:
             console.print(f"❌ Execution failed: {e}", style="bold red")
             return 1
     
+    @staticmethod
+    def _dispatch_signal(signum: int, frame) -> None:
+        """
+        Forward a process signal to the most recently created application.
+        
+        With no live application the signal gets its default behaviour:
+        SIGINT raises KeyboardInterrupt, other signals are re-raised with the
+        default handler restored, so SIGTERM still terminates the process.
+        """
+        app_ref = IOEApplication._active_instance
+        app = app_ref() if app_ref is not None else None
+        if app is not None:
+            app._signal_handler(signum, frame)
+        elif signum == signal.SIGINT:
+            raise KeyboardInterrupt
+        else:
+            signal.signal(signum, signal.SIG_DFL)
+            signal.raise_signal(signum)
+    
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle system signals for graceful shutdown."""
         signal_names = {signal.SIGINT: "SIGINT", signal.SIGTERM: "SIGTERM"}
@@ -410,12 +473,13 @@ class IOEApplication:
         if self.logger:
             self.logger.info(f"Received {signal_name}, starting shutdown procedure")
         
-        self.is_running = False
+        self._stop_event.set()
     
     def _shutdown(self) -> None:
-        """Gracefully shutdown application and cleanup resources."""
-        if not self.is_running:
+        """Gracefully shutdown application and cleanup resources (runs once)."""
+        if self._shutdown_done:
             return
+        self._shutdown_done = True
         
         try:
             console.print("🔄 Shutting down application...", style="yellow")
@@ -444,11 +508,6 @@ class IOEApplication:
             
         except Exception as e:
             console.print(f"❌ Error during shutdown: {e}", style="red")
-    
-    def _cleanup_on_exit(self) -> None:
-        """Cleanup function called on application exit."""
-        if self.is_running:
-            self._shutdown()
 
 #######################################################################################################################
 # Command Line Interface
@@ -501,7 +560,18 @@ def main(config: str, log_level: str, debug: bool, verbose: bool) -> None:
 
 
 def _print_application_banner(verbose: bool = False) -> None:
-    """Print application banner and information."""
+    """Print application banner and information (rendered once, then replayed)."""
+    cache_key = (verbose, os.getcwd() if verbose else None)
+    banner = _banner_cache.get(cache_key)
+    if banner is None:
+        with console.capture() as capture:
+            _render_application_banner(verbose)
+        banner = _banner_cache[cache_key] = capture.get()
+    console.file.write(banner)
+
+
+def _render_application_banner(verbose: bool) -> None:
+    """Render application banner through the Rich pipeline."""
     console.print()
     console.print("═" * 80, style="blue")
     
@@ -513,11 +583,11 @@ def _print_application_banner(verbose: bool = False) -> None:
     table.add_row("Application", f"{APP_NAME}")
     table.add_row("Version", f"{APP_VERSION}")
     table.add_row("Description", f"{APP_DESCRIPTION}")
-    table.add_row("Python", f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+    table.add_row("Python", _STATIC_APP_INFO["python_version"])
     table.add_row("Team", "IOE INNOVATION Team")
     
     if verbose:
-        table.add_row("Platform", f"{sys.platform}")
+        table.add_row("Platform", _STATIC_APP_INFO["platform"])
         table.add_row("Working Dir", f"{os.getcwd()}")
         table.add_row("Config Path", f"{DEFAULT_CONFIG_PATH}")
     
@@ -536,15 +606,7 @@ def get_application_info() -> Dict[str, Any]:
     Returns:
         Dictionary containing application metadata
     """
-    return {
-        "name": APP_NAME,
-        "version": APP_VERSION,
-        "description": APP_DESCRIPTION,
-        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-        "platform": sys.platform,
-        "working_directory": os.getcwd(),
-        "config_path": DEFAULT_CONFIG_PATH
-    }
+    return {**_STATIC_APP_INFO, "working_directory": os.getcwd()}
 
 
 def health_check() -> Dict[str, Any]:
@@ -32,14 +32,23 @@ Notes:         [ADDITIONAL_NOTES]
 # Standard library imports
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
-from typing import List, Dict, Optional, Union, Any, Tuple
+import logging.handlers
+from typing import List, Dict, Optional, Union, Any, Tuple, Callable
 from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 
 # Third-party imports
 import numpy as np
 import pandas as pd
+import yaml
 # Add other third-party imports here
 
 # Local imports
@@ -59,6 +68,18 @@ MAX_RETRY_COUNT = 3
 CONFIG_FILE_PATH = "config/settings.yaml"
 LOG_LEVEL = "INFO"
 BUFFER_SIZE = 1024
+CONFIG_CACHE_SIZE = 100
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 #######################################################################################################################
 # Type Definitions
@@ -69,6 +90,18 @@ ResultTuple = Tuple[bool, Optional[str]]
 DataList = List[Dict[str, Any]]
 ProcessingCallback = Union[None, callable]
 
+#######################################################################################################################
+# Global Variables
+#######################################################################################################################
+# Parsed configurations keyed by path, validated against (mtime, size)
+_config_cache: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+
+# Background listeners that own the real log handlers
+_log_listeners: List[logging.handlers.QueueListener] = []
+
+# Configured loggers keyed by (name, level, log_file)
+_logger_cache: Dict[Tuple[str, str, Optional[str]], logging.Logger] = {}
+
 #######################################################################################################################
 # Exception Classes
 #######################################################################################################################
@@ -102,6 +135,10 @@ class IOE[MODULE_NAME]ConnectionError(IOE[MODULE_NAME]Exception):
     """Raised when connection operations fail."""
     pass
 
+
+# Errors a single malformed item can raise; anything else is a bug and propagates
+ITEM_ERRORS = (KeyError, ValueError, TypeError, AttributeError, IOE[MODULE_NAME]ProcessingError)
+
 #######################################################################################################################
 # Helper Functions
 #######################################################################################################################
@@ -142,10 +179,36 @@ def format_error_message(error: Exception, context: Optional[str] = None) -> str
     return base_message
 
 
+def _has_uniform_keys(items: DataList) -> bool:
+    """
+    Check whether all items are dictionaries with the same set of keys.
+    
+    Args:
+        items: Non-empty sequence of data items
+        
+    Returns:
+        True if every item has the keys of the first item and no others
+    """
+    try:
+        keys = items[0].keys()
+        return all(item.keys() == keys for item in items)
+    except AttributeError:
+        return False
+
+
+def _no_progress(current: int, total: int) -> None:
+    """Progress callback used when the caller does not supply one."""
+
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
     Setup logging configuration for the module.
     
+    The logger only enqueues records; formatting and I/O run on a background
+    QueueListener thread that is stopped by stop_logging() at exit. Repeated
+    calls return the already configured logger instead of adding handlers,
+    except that a newly requested log_file is attached to it.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional log file path
@@ -153,35 +216,114 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
     Returns:
         Configured logger instance
     """
+    cache_key = (MODULE_NAME, level, log_file)
+    cached_logger = _logger_cache.get(cache_key)
+    if cached_logger is not None:
+        return cached_logger
+    
     logger = logging.getLogger(MODULE_NAME)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_LEVEL_MAP.get(level.upper(), logging.INFO))
+    _logger_cache[cache_key] = logger
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
+    # Handlers are attached once per named logger; a new log file joins the existing ones
+    if logger.handlers:
+        if log_file:
+            _add_log_file(logger, log_file)
+        return logger
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers: List[logging.Handler] = [console_handler]
     
     # File handler (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(_buffered_file_handler(log_file))
+    
+    # Queue handler on the logger, real handlers on the listener thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    
+    if not _log_listeners:
+        atexit.register(stop_logging)
+    _log_listeners.append(listener)
     
     return logger
 
+
+def _buffered_file_handler(log_file: str) -> logging.Handler:
+    """
+    Create a file handler buffered for BUFFER_SIZE records or until an error.
+    
+    Args:
+        log_file: Log file path
+        
+    Returns:
+        Memory handler flushing into the log file
+    """
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return logging.handlers.MemoryHandler(capacity=BUFFER_SIZE, flushLevel=logging.ERROR, target=file_handler)
+
+
+def _add_log_file(logger: logging.Logger, log_file: str) -> None:
+    """
+    Attach a file handler for log_file to an already configured logger.
+    
+    The handler goes to the listener draining the logger's queue; a logger
+    configured elsewhere gets a plain FileHandler. Each file is attached once.
+    
+    Args:
+        logger: Logger that already has handlers
+        log_file: Log file path
+    """
+    log_path = os.path.abspath(log_file)
+    queues = {handler.queue for handler in logger.handlers if isinstance(handler, logging.handlers.QueueHandler)}
+    
+    for listener in _log_listeners:
+        if listener.queue not in queues:
+            continue
+        if any(getattr(getattr(handler, 'target', None), 'baseFilename', None) == log_path
+               for handler in listener.handlers):
+            return
+        # The listener thread reads its handlers per record; replacing the tuple is atomic
+        listener.handlers = listener.handlers + (_buffered_file_handler(log_file),)
+        return
+    
+    if not any(getattr(handler, 'baseFilename', None) == log_path for handler in logger.handlers):
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(file_handler)
+
+
+def flush_logging() -> None:
+    """Flush buffered log records held by the background logging handlers."""
+    for listener in _log_listeners:
+        for handler in listener.handlers:
+            handler.flush()
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the background logging listeners."""
+    while _log_listeners:
+        listener = _log_listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
 #######################################################################################################################
 # Main Classes
 #######################################################################################################################
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IOE[MODULE_NAME]Config:
     """
     Configuration class for [MODULE_NAME] module.
     
+    Instances are immutable and validated on construction, so an invalid
+    configuration cannot exist and one instance can be shared freely.
+    
     Attributes:
         parameter1: Description of parameter1
         parameter2: Description of parameter2
@@ -195,6 +337,10 @@ class IOE[MODULE_NAME]Config:
     timeout: int = DEFAULT_TIMEOUT
     max_retries: int = MAX_RETRY_COUNT
     
+    def __post_init__(self) -> None:
+        """Validate configuration parameters on construction."""
+        self.validate()
+    
     def validate(self) -> bool:
         """
         Validate configuration parameters.
@@ -236,6 +382,8 @@ class IOE[MODULE_NAME]:
         >>> result = processor.process_data(sample_data)
     """
     
+    __slots__ = ('config', 'logger', 'is_initialized', '_initialized_at', '_process_count', '_error_count')
+    
     def __init__(self, config: IOE[MODULE_NAME]Config, logger: Optional[logging.Logger] = None) -> None:
         """
         Initialize [MODULE_NAME] with configuration.
@@ -243,17 +391,13 @@ class IOE[MODULE_NAME]:
         Args:
             config: Module configuration object
             logger: Optional logger instance
-            
-        Raises:
-            IOE[MODULE_NAME]ValidationError: If configuration is invalid
         """
-        # Validate configuration
-        config.validate()
-        
         self.config = config
         self.logger = logger or setup_logging()
         self.is_initialized = False
-        self._internal_state: Dict[str, Any] = {}
+        self._initialized_at: Optional[int] = None
+        self._process_count = 0
+        self._error_count = 0
         
         # Initialize module
         self._initialize()
@@ -266,30 +410,38 @@ class IOE[MODULE_NAME]:
             IOE[MODULE_NAME]ProcessingError: If initialization fails
         """
         try:
-            self.logger.info(f"Initializing {MODULE_NAME} module version {MODULE_VERSION}")
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info("Initializing %s module version %s", MODULE_NAME, MODULE_VERSION)
             
             # Add initialization logic here
-            self._internal_state = {
-                "initialized_at": pd.Timestamp.now(),
-                "process_count": 0,
-                "error_count": 0
-            }
+            self._initialized_at = time.time_ns()
+            self._process_count = 0
+            self._error_count = 0
             
             self.is_initialized = True
-            self.logger.info("Module initialized successfully")
+            if log_info:
+                self.logger.info("Module initialized successfully")
             
         except Exception as e:
             error_msg = f"Module initialization failed: {e}"
             self.logger.error(error_msg)
             raise IOE[MODULE_NAME]ProcessingError(error_msg) from e
     
-    def process_data(self, input_data: DataList, callback: ProcessingCallback = None) -> Dict[str, Any]:
+    def process_data(self, input_data: Union[DataList, np.ndarray, pd.DataFrame], callback: ProcessingCallback = None,
+                     copy_items: bool = True) -> Dict[str, Any]:
         """
         Process input data according to module configuration.
         
         Input Requirements:
-        - input_data: Must be a list of dictionaries with valid structure
+        - input_data: Sequence of dictionaries (list, tuple, 1-D object
+          ndarray, ...) with valid structure, or a DataFrame with one row per
+          item; mappings and strings are rejected
         - callback: Optional callable for progress updates
+        - copy_items: When False, the input dicts are updated in place and
+          returned, so results alias the caller's data
+        - Without a callback, a DataFrame or items that all share one key set
+          are processed in a single DataFrame pass with the same results
         
         Output Specifications:
         - Returns dictionary with processing results
@@ -302,8 +454,9 @@ class IOE[MODULE_NAME]:
         - Calls callback function if provided
         
         Args:
-            input_data: List of data dictionaries to process
+            input_data: Data dictionaries or DataFrame rows to process
             callback: Optional callback function for progress updates
+            copy_items: Copy each item before adding processing fields
             
         Returns:
             Dictionary containing processing results and metadata
@@ -321,69 +474,174 @@ class IOE[MODULE_NAME]:
             raise IOE[MODULE_NAME]ProcessingError("Module not initialized")
         
         # Input validation
-        if not isinstance(input_data, list):
-            raise IOE[MODULE_NAME]ValidationError("input_data must be a list")
+        is_frame = isinstance(input_data, pd.DataFrame)
+        is_array = isinstance(input_data, np.ndarray) and input_data.ndim == 1
+        is_sequence = isinstance(input_data, Sequence) and not isinstance(input_data, (str, bytes, bytearray))
+        if not (is_frame or is_array or is_sequence):
+            raise IOE[MODULE_NAME]ValidationError("input_data must be a sequence of items, a 1-D array or a DataFrame")
+        
+        total_count = len(input_data)
+        
+        if self.config.enable_validation and not is_frame and not all(map(validate_input, input_data)):
+            # The index is only looked up once validation has failed
+            bad_index = next(i for i, item in enumerate(input_data) if not validate_input(item))
+            raise IOE[MODULE_NAME]ValidationError(f"Invalid data at index {bad_index}")
+        
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info("Starting data processing for %d items", total_count)
+        
+        # Processing logic; one timestamp is shared by every item in the batch
+        now_iso = datetime.now().isoformat()
+        error_items: DataList = []
+        
+        processed_items = None
+        if callback is None and total_count and (is_frame or (copy_items and _has_uniform_keys(input_data))):
+            # Vectorized path: one DataFrame pass instead of a per-item Python loop. Items must
+            # share one key set, and object columns keep their values (no NaN fill, no int -> float)
+            try:
+                frame = input_data if is_frame else pd.DataFrame(list(input_data), dtype=object)
+                processed_items = self._process_frame(frame, now_iso)
+            except (ValueError, TypeError) as e:
+                self.logger.debug("Vectorized processing failed, falling back to per-item: %s", e)
+        
+        if processed_items is None:
+            items = input_data.to_dict("records") if is_frame else input_data
+            processed_items, error_items = self._process_items(items, callback, now_iso, copy_items)
+        
+        # Update statistics
+        processed_count = len(processed_items)
+        error_count = len(error_items)
+        self._error_count += error_count
+        self._process_count += total_count
+        
+        # Prepare results
+        results = {
+            "processed_items": processed_items,
+            "processed_count": processed_count,
+            "error_items": error_items,
+            "error_count": error_count,
+            "total_items": total_count,
+            "success_rate": processed_count / total_count if total_count else 0,
+            "processing_timestamp": now_iso,
+            "module_version": MODULE_VERSION
+        }
         
-        if self.config.enable_validation:
-            for i, item in enumerate(input_data):
-                if not validate_input(item):
-                    raise IOE[MODULE_NAME]ValidationError(f"Invalid data at index {i}")
+        if log_info:
+            self.logger.info("Processing completed: %d/%d items succeeded", processed_count, total_count)
         
-        self.logger.info(f"Starting data processing for {len(input_data)} items")
+        return results
+    
+    def _process_frame(self, frame: pd.DataFrame, processed_at: str) -> DataList:
+        """
+        Process a whole batch of items as a single DataFrame.
         
-        try:
-            # Processing logic
-            processed_items = []
-            error_items = []
-            
-            for i, item in enumerate(input_data):
-                try:
-                    # Add actual processing logic here
-                    processed_item = self._process_single_item(item)
-                    processed_items.append(processed_item)
-                    
-                    # Progress callback
-                    if callback:
-                        callback(i + 1, len(input_data))
-                        
-                except Exception as e:
-                    error_msg = f"Error processing item {i}: {e}"
-                    self.logger.warning(error_msg)
-                    error_items.append({"index": i, "item": item, "error": str(e)})
-                    self._internal_state["error_count"] += 1
-            
-            # Update statistics
-            self._internal_state["process_count"] += len(input_data)
-            
-            # Prepare results
-            results = {
-                "processed_items": processed_items,
-                "processed_count": len(processed_items),
-                "error_items": error_items,
-                "error_count": len(error_items),
-                "total_items": len(input_data),
-                "success_rate": len(processed_items) / len(input_data) if input_data else 0,
-                "processing_timestamp": pd.Timestamp.now().isoformat(),
-                "module_version": MODULE_VERSION
-            }
+        Only used when every item has the same keys, so each output record
+        matches what _process_items returns for the same item.
+        
+        Args:
+            frame: Batch of data items, one row per item
+            processed_at: ISO timestamp recorded on every item
             
-            self.logger.info(
-                f"Processing completed: {results['processed_count']}/{results['total_items']} items succeeded"
-            )
+        Returns:
+            List of processed data items
+        """
+        # Add vectorized column operations here
+        frame = frame.assign(processed=True, processed_at=processed_at)
+        
+        return frame.to_dict("records")
+    
+    def _process_items(self, input_data: DataList, callback: ProcessingCallback,
+                       processed_at: str, copy_items: bool = True) -> Tuple[DataList, DataList]:
+        """
+        Process items one at a time, reporting progress after each item.
+        
+        The loop runs without per-item exception handling and inlines the body
+        of _process_single_item to avoid a method call per item; the first
+        failure hands the rest of the batch to _process_items_checked.
+        
+        Args:
+            input_data: List of data dictionaries to process
+            callback: Optional callback function for progress updates
+            processed_at: ISO timestamp recorded on every item
+            copy_items: Copy each item before adding processing fields
             
-            return results
+        Returns:
+            Tuple of (processed items, error items)
+        """
+        report = callback or _no_progress
+        total = len(input_data)
+        processed_items = []
+        append_item = processed_items.append
+        
+        i = 0
+        try:
+            for i, item in enumerate(input_data):
+                # Inlined _process_single_item: keep both in sync. dict.copy() is
+                # faster than building a per-schema dict literal for each item
+                processed_item = item.copy() if copy_items else item
+                processed_item["processed"] = True
+                processed_item["processed_at"] = processed_at
+                append_item(processed_item)
+                report(i + 1, total)
+        except ITEM_ERRORS:
+            return self._process_items_checked(input_data, i, processed_items[:i], report,
+                                               processed_at, copy_items)
+        
+        return processed_items, []
+    
+    def _process_items_checked(self, input_data: DataList, start: int, processed_items: DataList,
+                               report: Callable[[int, int], None], processed_at: str,
+                               copy_items: bool = True) -> Tuple[DataList, DataList]:
+        """
+        Process the remaining items with per-item error collection.
+        
+        Args:
+            input_data: List of data dictionaries to process
+            start: Index of the first item that has not been processed
+            processed_items: Items already processed before start
+            report: Progress callback
+            processed_at: ISO timestamp recorded on every item
+            copy_items: Copy each item before adding processing fields
             
-        except Exception as e:
-            error_msg = f"Data processing failed: {e}"
-            self.logger.error(error_msg)
-            raise IOE[MODULE_NAME]ProcessingError(error_msg) from e
+        Returns:
+            Tuple of (processed items, error items)
+        """
+        # Errors are collected as parallel lists and turned into dicts once at the end
+        error_indices: List[int] = []
+        error_messages: List[str] = []
+        total = len(input_data)
+        
+        for i in range(start, total):
+            item = input_data[i]
+            try:
+                processed_items.append(self._process_single_item(item, processed_at, copy_items))
+                report(i + 1, total)
+                
+            except ITEM_ERRORS as e:
+                self.logger.warning("Error processing item %d: %s", i, e)
+                error_indices.append(i)
+                error_messages.append(str(e))
+        
+        error_items = [
+            {"index": index, "item": input_data[index], "error": message}
+            for index, message in zip(error_indices, error_messages)
+        ]
+        
+        return processed_items, error_items
     
-    def _process_single_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_single_item(self, item: Dict[str, Any], processed_at: str,
+                             copy_item: bool = True) -> Dict[str, Any]:
         """
         Process a single data item.
         
+        This is the reference implementation used on the error-collecting
+        path; the fast loop in _process_items inlines the same body.
+        
         Args:
             item: Data item to process
+            processed_at: ISO timestamp recorded on the item
+            copy_item: Copy the item first instead of updating it in place
             
         Returns:
             Processed data item
@@ -392,9 +650,9 @@ class IOE[MODULE_NAME]:
             IOE[MODULE_NAME]ProcessingError: If item processing fails
         """
         # Add specific item processing logic here
-        processed_item = item.copy()
+        processed_item = item.copy() if copy_item else item
         processed_item["processed"] = True
-        processed_item["processed_at"] = pd.Timestamp.now().isoformat()
+        processed_item["processed_at"] = processed_at
         
         return processed_item
     
@@ -411,9 +669,9 @@ class IOE[MODULE_NAME]:
         return {
             "module_name": MODULE_NAME,
             "module_version": MODULE_VERSION,
-            "initialized_at": self._internal_state.get("initialized_at"),
-            "total_processed": self._internal_state.get("process_count", 0),
-            "total_errors": self._internal_state.get("error_count", 0),
+            "initialized_at": self._initialized_at,
+            "total_processed": self._process_count,
+            "total_errors": self._error_count,
             "is_initialized": self.is_initialized,
             "configuration": {
                 "parameter1": self.config.parameter1,
@@ -426,8 +684,8 @@ class IOE[MODULE_NAME]:
     def reset_statistics(self) -> None:
         """Reset internal processing statistics."""
         if self.is_initialized:
-            self._internal_state["process_count"] = 0
-            self._internal_state["error_count"] = 0
+            self._process_count = 0
+            self._error_count = 0
             self.logger.info("Statistics reset successfully")
     
     def cleanup(self) -> None:
@@ -441,10 +699,13 @@ class IOE[MODULE_NAME]:
             self.logger.info("Cleaning up module resources")
             
             # Add cleanup logic here
-            self._internal_state.clear()
+            self._initialized_at = None
+            self._process_count = 0
+            self._error_count = 0
             self.is_initialized = False
             
             self.logger.info("Module cleanup completed")
+            flush_logging()
 
 #######################################################################################################################
 # Module Functions
@@ -469,6 +730,8 @@ def load_config_from_file(config_path: str) -> IOE[MODULE_NAME]Config:
     """
     Load configuration from file.
     
+    Parsed files are cached and reused until their mtime or size changes.
+    
     Args:
         config_path: Path to configuration file
         
@@ -480,14 +743,24 @@ def load_config_from_file(config_path: str) -> IOE[MODULE_NAME]Config:
         FileNotFoundError: If config file doesn't exist
     """
     try:
+        # Reuse the parsed configuration while the file is unchanged
+        stat = os.stat(config_path)
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            _config_cache.move_to_end(config_path)
+            return cached[2]
+        
         # Add configuration loading logic here
         # This example assumes YAML format
-        import yaml
-        
         with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=YAML_LOADER)
         
-        return IOE[MODULE_NAME]Config(**config_data)
+        config = IOE[MODULE_NAME]Config(**config_data)
+        _config_cache[config_path] = (stat.st_mtime, stat.st_size, config)
+        if len(_config_cache) > CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+        
+        return config
         
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
@@ -495,10 +768,51 @@ def load_config_from_file(config_path: str) -> IOE[MODULE_NAME]Config:
         raise IOE[MODULE_NAME]ValidationError(f"Failed to load configuration: {e}")
 
 
+def _init_batch_worker() -> None:
+    """
+    Reset logging inherited from the parent in a batch worker process.
+    
+    A forked worker inherits the parent's QueueHandler but not its listener
+    thread, so queued records would never be written. Workers also exit
+    without running atexit hooks, so they log synchronously instead.
+    """
+    _logger_cache.clear()
+    _log_listeners.clear()
+    
+    logger = logging.getLogger(MODULE_NAME)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(console_handler)
+
+
+def _process_batch_worker(data_batch: DataList, config: IOE[MODULE_NAME]Config) -> Dict[str, Any]:
+    """
+    Process one data batch with a processor owned by the worker process.
+    
+    Args:
+        data_batch: Data batch to process
+        config: Module configuration
+        
+    Returns:
+        Processing result for the batch
+    """
+    processor = IOE[MODULE_NAME](config)
+    try:
+        return processor.process_data(data_batch)
+    finally:
+        processor.cleanup()
+
+
 def process_data_batch(data_list: List[DataList], config: IOE[MODULE_NAME]Config) -> List[Dict[str, Any]]:
     """
     Process multiple data batches using the module.
     
+    Batches are independent, so two or more of them are spread across a
+    process pool with one processor per worker; results keep input order.
+    
     Args:
         data_list: List of data batches to process
         config: Module configuration
@@ -509,19 +823,24 @@ def process_data_batch(data_list: List[DataList], config: IOE[MODULE_NAME]Config
     Raises:
         IOE[MODULE_NAME]ProcessingError: If batch processing fails
     """
-    processor = IOE[MODULE_NAME](config)
-    results = []
+    if len(data_list) < 2:
+        # Not worth the process pool start-up cost
+        results = [_process_batch_worker(data_batch, config) for data_batch in data_list]
+    else:
+        results = [None] * len(data_list)
+        max_workers = min(len(data_list), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker) as executor:
+            futures = {
+                executor.submit(_process_batch_worker, data_batch, config): i
+                for i, data_batch in enumerate(data_list)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
     
-    try:
-        for i, data_batch in enumerate(data_list):
-            batch_result = processor.process_data(data_batch)
-            batch_result["batch_index"] = i
-            results.append(batch_result)
-            
-        return results
-        
-    finally:
-        processor.cleanup()
+    for i, batch_result in enumerate(results):
+        batch_result["batch_index"] = i
+    
+    return results
 
 
 def main_function() -> None:
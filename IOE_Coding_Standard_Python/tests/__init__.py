@@ -0,0 +1,23 @@
+"""
+*******************************************************************************************************************
+General Information
+********************************************************************************************************************
+Project:       IOE Python Coding Standards
+File:          __init__.py
+Description:   IOE test suite package initialization
+
+Author:        IOE Development Team
+Email:         team@ioe.innovation
+Created:       2025-10-23
+Last Update:   2025-10-23
+Version:       1.0.0
+
+Python:        3.8+
+Dependencies:  None
+
+Copyright:     (c) 2025 IOE INNOVATION Team
+License:       MIT
+
+Notes:         Test suite package initialization
+*******************************************************************************************************************
+"""
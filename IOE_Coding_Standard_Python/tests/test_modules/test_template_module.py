@@ -0,0 +1,144 @@
+"""
+*******************************************************************************************************************
+General Information
+********************************************************************************************************************
+Project:       IOE Python Coding Standards
+File:          test_template_module.py
+Description:   Unit tests for the module template (templates/template_module.py)
+
+Author:        IOE Development Team
+Email:         team@ioe.innovation
+Created:       2025-10-23
+Last Update:   2025-10-23
+Version:       1.0.0
+
+Python:        3.10+
+Dependencies:  pytest, numpy, pandas, pyyaml
+
+Copyright:     (c) 2025 IOE INNOVATION Team
+License:       MIT
+
+Notes:         The template is rendered with a concrete module name and loaded
+               as a regular module before testing
+*******************************************************************************************************************
+"""
+
+#######################################################################################################################
+# Imports
+#######################################################################################################################
+# Standard library imports
+import sys
+import types
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+#######################################################################################################################
+# Constants and Configuration
+#######################################################################################################################
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+TEMPLATE_PATH = PROJECT_ROOT / "templates" / "template_module.py"
+RENDERED_NAME = "Demo"
+
+#######################################################################################################################
+# Fixtures
+#######################################################################################################################
+@pytest.fixture(scope="module")
+def template() -> Iterator[types.ModuleType]:
+    """Render the module template as module 'ioe_demo' and import it."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    source = TEMPLATE_PATH.read_text(encoding="utf-8").replace("[MODULE_NAME]", RENDERED_NAME)
+    module = types.ModuleType("ioe_demo")
+    module.__file__ = str(TEMPLATE_PATH)
+    sys.modules[module.__name__] = module
+    exec(compile(source, str(TEMPLATE_PATH), "exec"), module.__dict__)
+    yield module
+
+    # Stop the logging listener while pytest's captured streams are still open
+    module.stop_logging()
+
+
+@pytest.fixture
+def processor(template: types.ModuleType) -> Any:
+    """Initialized processor with the default configuration."""
+    return getattr(template, f"IOE{RENDERED_NAME}")(template.create_default_config())
+
+#######################################################################################################################
+# Helper Functions
+#######################################################################################################################
+def _records(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Processed items of a result without the per-call timestamp."""
+    return [{k: v for k, v in item.items() if k != "processed_at"} for item in result["processed_items"]]
+
+
+def _no_progress(current: int, total: int) -> None:
+    """Callback that only forces the per-item path."""
+
+#######################################################################################################################
+# Tests
+#######################################################################################################################
+@pytest.mark.parametrize("data", [
+    [{"id": 1, "value": 100}, {"id": 2, "value": 200}],
+    [{"id": 1, "value": None}, {"value": 2.5, "id": 2}],
+    [{"a": 1}, {"b": 2}],
+])
+def test_process_data_paths_return_same_records(processor: Any, data: List[Dict[str, Any]]) -> None:
+    """Processing without a callback gives the same records as the per-item path."""
+    vectorized = processor.process_data(data)
+    per_item = processor.process_data(data, callback=_no_progress)
+
+    assert _records(vectorized) == _records(per_item)
+    assert [{k: type(v) for k, v in item.items()} for item in _records(vectorized)] == \
+           [{k: type(v) for k, v in item.items()} for item in _records(per_item)]
+
+
+def test_process_data_frame_matches_records(processor: Any) -> None:
+    """A DataFrame input gives the same records as its rows passed as dictionaries."""
+    data = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+    assert _records(processor.process_data(pd.DataFrame(data))) == _records(processor.process_data(data))
+
+
+def test_process_data_without_copy_updates_items(processor: Any) -> None:
+    """copy_items=False returns the caller's dictionaries updated in place."""
+    data = [{"id": 1}, {"id": 2}]
+
+    result = processor.process_data(data, copy_items=False)
+
+    assert all(item is original for item, original in zip(result["processed_items"], data))
+    assert all(item["processed"] for item in data)
+
+
+def test_process_data_accepts_object_array(processor: Any) -> None:
+    """A 1-D object array of dictionaries gives the same records as a list."""
+    data = [{"id": 1, "value": 100}, {"id": 2, "value": 200}]
+    array = np.empty(len(data), dtype=object)
+    array[:] = data
+
+    assert _records(processor.process_data(array)) == _records(processor.process_data(data))
+    assert _records(processor.process_data(array, callback=_no_progress)) == _records(processor.process_data(data))
+
+
+@pytest.mark.parametrize("data", [{"a": [1, 2]}, "ab", b"ab", {1, 2}, np.zeros((2, 2))])
+def test_process_data_rejects_non_sequences(template: types.ModuleType, processor: Any, data: Any) -> None:
+    """Mappings, strings, multi-dimensional arrays and other non-sequence containers are rejected."""
+    with pytest.raises(getattr(template, f"IOE{RENDERED_NAME}ValidationError")):
+        processor.process_data(data)
+
+
+def test_setup_logging_adds_later_log_file(template: types.ModuleType, tmp_path: Path) -> None:
+    """A log file requested after the logger was configured still receives records."""
+    log_file = tmp_path / "module.log"
+    template.setup_logging()
+
+    logger = template.setup_logging("INFO", log_file=str(log_file))
+    logger.info("written to file")
+    template.stop_logging()
+
+    assert "written to file" in log_file.read_text()
@@ -37,9 +37,14 @@ import os
 import ast
 import re
 import sys
+import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterator, NamedTuple
 from datetime import datetime
+from collections import Counter, deque
+from itertools import islice
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Third-party imports
 import click
@@ -47,19 +52,39 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 
+# Third-party imports (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 #######################################################################################################################
 # Constants and Configuration
 #######################################################################################################################
 TOOL_VERSION = "1.0.0"
 TOOL_NAME = "IOE Format Checker"
 
-# IOE naming conventions
+# Per-directory cache of check results for unchanged files
+CACHE_FILE_NAME = ".ioe_format_cache.json"
+
+# Threads reading files ahead of the single-process checker, and how many reads may be in flight
+READ_AHEAD_WORKERS = 8
+READ_AHEAD_WINDOW = READ_AHEAD_WORKERS * 2
+
+# Files checked between progress bar updates
+PROGRESS_BATCH_SIZE = 32
+
+# Directory names skipped when searching for Python files
+EXCLUDED_DIR_NAMES = frozenset({'__pycache__', '.venv', 'venv', '.git', 'build', 'dist'})
+
+# IOE naming conventions (compiled once at import)
 IOE_PREFIX_PATTERNS = {
-    'class': r'^IOE[A-Z][a-zA-Z0-9]*$',
-    'function': r'^[a-z][a-z0-9_]*$',
-    'constant': r'^[A-Z][A-Z0-9_]*$',
-    'variable': r'^[a-z][a-z0-9_]*$',
-    'module': r'^ioe_[a-z][a-z0-9_]*$'
+    'class': re.compile(r'^IOE[A-Z][a-zA-Z0-9]*$'),
+    'function': re.compile(r'^[a-z][a-z0-9_]*$'),
+    'constant': re.compile(r'^[A-Z][A-Z0-9_]*$'),
+    'variable': re.compile(r'^[a-z][a-z0-9_]*$'),
+    'module': re.compile(r'^ioe_[a-z][a-z0-9_]*$')
 }
 
 # Required header sections
@@ -78,6 +103,35 @@ REQUIRED_HEADER_SECTIONS = [
     "License:"
 ]
 
+# Section comments expected in the body of a module
+EXPECTED_CODE_SECTIONS = [
+    "Imports",
+    "Constants and Configuration",
+    "Global Variables",
+    "Helper Functions",
+    "Main Functions"
+]
+
+# Section comments expected inside the import block
+IMPORT_SECTION_REGEX = re.compile(r'Standard library|Third-party|Local imports')
+
+# All header sections as one alternation, so a header is scanned once
+HEADER_SECTION_REGEX = re.compile('|'.join(re.escape(section) for section in REQUIRED_HEADER_SECTIONS))
+
+# Comment line naming one of the expected code sections
+SECTION_COMMENT_REGEX = re.compile(
+    r'^[ \t]*#.*?(?:' + '|'.join(re.escape(section) for section in EXPECTED_CODE_SECTIONS) + ')', re.M
+)
+
+# Whitespace at the end of a line (or of the file), excluding the newline itself
+TRAILING_WHITESPACE_REGEX = re.compile(r'[^\S\n]+(?=\n|\Z)')
+
+# Main execution guard, with either quote style
+MAIN_GUARD_REGEX = re.compile(r'if\s+__name__\s*==\s*[\'"]__main__[\'"]\s*:')
+
+# A line that is not blank, a comment, a docstring delimiter or an import
+EXECUTABLE_LINE_REGEX = re.compile(r'^[ \t\f\v]*(?!#|"""|\'\'\'|import |from )\S', re.M)
+
 #######################################################################################################################
 # Global Variables
 #######################################################################################################################
@@ -86,20 +140,83 @@ console = Console()
 #######################################################################################################################
 # Helper Classes
 #######################################################################################################################
-class CodeIssue:
+class CodeIssue(NamedTuple):
     """Represents a code issue found during checking."""
-    
-    def __init__(self, file_path: str, line_number: int, issue_type: str, 
-                 message: str, severity: str = "warning"):
-        self.file_path = file_path
-        self.line_number = line_number
-        self.issue_type = issue_type
-        self.message = message
-        self.severity = severity  # "error", "warning", "info"
+    file_path: str
+    line_number: int
+    issue_type: str
+    message: str
+    severity: str = "warning"  # "error", "warning", "info"
     
     def __str__(self) -> str:
         return f"{self.file_path}:{self.line_number} [{self.severity.upper()}] {self.issue_type}: {self.message}"
 
+
+@dataclass
+class FileContext:
+    """File content and AST shared by all checks of one file."""
+    path: Path
+    text: str
+    lines: List[str]
+    tree: Optional[ast.AST]
+    syntax_error: Optional[SyntaxError]
+
+
+class FileStats(NamedTuple):
+    """Size and structure counts for one file, used by the stats command."""
+    lines: int
+    functions: int
+    classes: int
+    imports: int
+    ioe_compliant: bool
+
+
+class _NamingVisitor(ast.NodeVisitor):
+    """
+    Collect class and function naming issues.
+    
+    Class and function bodies are both descended into, so methods and
+    definitions nested inside functions are checked too.
+    """
+    
+    # Bound match methods, so each node avoids the pattern dict lookup
+    _match_class_name = staticmethod(IOE_PREFIX_PATTERNS['class'].match)
+    _match_function_name = staticmethod(IOE_PREFIX_PATTERNS['function'].match)
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.issues: List[CodeIssue] = []
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        class_name = node.name
+        
+        # IOE classes should start with IOE
+        if not class_name.startswith('IOE') and not class_name.startswith('_'):
+            self.issues.append(CodeIssue(
+                self.file_path, node.lineno, "naming",
+                f"Class '{class_name}' should follow IOE naming convention (start with 'IOE')", "warning"
+            ))
+        elif class_name.startswith('IOE') and not self._match_class_name(class_name):
+            self.issues.append(CodeIssue(
+                self.file_path, node.lineno, "naming",
+                f"Class '{class_name}' doesn't follow IOE class naming pattern", "warning"
+            ))
+        
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        func_name = node.name
+        
+        # Skip private and magic methods
+        if not func_name.startswith('_'):
+            if not self._match_function_name(func_name):
+                self.issues.append(CodeIssue(
+                    self.file_path, node.lineno, "naming",
+                    f"Function '{func_name}' should use snake_case naming", "info"
+                ))
+        
+        self.generic_visit(node)
+
 #######################################################################################################################
 # Helper Functions
 #######################################################################################################################
@@ -109,45 +226,87 @@ def find_python_files(directory: Path, exclude_patterns: List[str] = None) -> Li
     
     Args:
         directory: Directory to search
-        exclude_patterns: Patterns to exclude
+        exclude_patterns: Directory names to exclude (default: EXCLUDED_DIR_NAMES)
     
     Returns:
         List of Python file paths
     """
-    if exclude_patterns is None:
-        exclude_patterns = ['__pycache__', '.venv', 'venv', '.git', 'build', 'dist']
+    exclude_dirs = EXCLUDED_DIR_NAMES if exclude_patterns is None else frozenset(exclude_patterns)
+    
+    return list(_scan_python_files(str(directory), exclude_dirs))
+
+
+def _scan_python_files(directory: str, exclude_dirs: frozenset) -> Iterator[Path]:
+    """
+    Recursively yield Python files, pruning excluded directories.
     
-    python_files = []
+    Directories are excluded by exact name, before descending into them,
+    and os.scandir entries answer is_dir/is_file without extra stat calls.
     
-    for file_path in directory.rglob("*.py"):
-        # Skip excluded directories
-        skip_file = False
-        for pattern in exclude_patterns:
-            if pattern in str(file_path):
-                skip_file = True
-                break
-        
-        if not skip_file:
-            python_files.append(file_path)
+    Args:
+        directory: Directory to scan
+        exclude_dirs: Directory names to exclude
+    
+    Yields:
+        Python file paths
+    """
+    try:
+        entries = os.scandir(directory)
+    except PermissionError:
+        return  # Unreadable directories are skipped, as Path.rglob does
     
-    return python_files
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    yield from _scan_python_files(entry.path, exclude_dirs)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield Path(entry.path)
 
 
-def check_file_header(file_path: Path) -> List[CodeIssue]:
+def load_file_context(file_path: Path, data: Optional[bytes] = None) -> FileContext:
     """
-    Check if file has proper IOE header format.
+    Read and parse a Python file once for all checks.
     
     Args:
         file_path: Path to Python file
+        data: File contents if already read, otherwise the file is read here
+    
+    Returns:
+        File context; tree is None and syntax_error is set if parsing fails
+    
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    # Raw read plus one decode skips the text-IO layer's chunked decoding
+    if data is None:
+        data = file_path.read_bytes()
+    text = data.decode('utf-8')
+    
+    try:
+        tree, syntax_error = ast.parse(text, str(file_path)), None
+    except SyntaxError as e:
+        tree, syntax_error = None, e
+    
+    return FileContext(file_path, text, text.splitlines(keepends=True), tree, syntax_error)
+
+
+def check_file_header(ctx: FileContext) -> List[CodeIssue]:
+    """
+    Check if file has proper IOE header format.
+    
+    Args:
+        ctx: Shared file context
     
     Returns:
         List of issues found
     """
     issues = []
+    file_path = ctx.path
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = ctx.text
         
         # Check if file starts with header
         if not content.startswith('"""'):
@@ -166,11 +325,10 @@ def check_file_header(file_path: Path) -> List[CodeIssue]:
             ))
             return issues
         
-        header_content = content[3:header_end]
-        
-        # Check required sections
+        # Check required sections, scanning the header in place instead of slicing it out
+        found_sections = set(HEADER_SECTION_REGEX.findall(content, 3, header_end))
         for section in REQUIRED_HEADER_SECTIONS:
-            if section not in header_content:
+            if section not in found_sections:
                 issues.append(CodeIssue(
                     str(file_path), 1, "header",
                     f"Missing required header section: {section}", "warning"
@@ -185,45 +343,63 @@ def check_file_header(file_path: Path) -> List[CodeIssue]:
     return issues
 
 
-def check_imports_organization(file_path: Path) -> List[CodeIssue]:
+def _iter_module_imports(statements: List[ast.stmt]) -> Iterator[ast.stmt]:
+    """
+    Yield module-level import statements in source order.
+    
+    Imports guarded by a module-level try/if (optional dependencies) are
+    included; function and class bodies are not searched.
+    
+    Args:
+        statements: Statements of a module or of a guarded block
+    
+    Yields:
+        Import and ImportFrom nodes
+    """
+    for node in statements:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, ast.Try):
+            yield from _iter_module_imports(node.body)
+            for handler in node.handlers:
+                yield from _iter_module_imports(handler.body)
+            yield from _iter_module_imports(node.orelse)
+            yield from _iter_module_imports(node.finalbody)
+        elif isinstance(node, ast.If):
+            yield from _iter_module_imports(node.body)
+            yield from _iter_module_imports(node.orelse)
+
+
+def check_imports_organization(ctx: FileContext) -> List[CodeIssue]:
     """
     Check imports organization according to IOE standards.
     
     Args:
-        file_path: Path to Python file
+        ctx: Shared file context
     
     Returns:
         List of issues found
     """
     issues = []
+    file_path = ctx.path
+    
+    if ctx.tree is None:
+        return issues  # Syntax errors are reported by check_naming_conventions
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Find import section from the module-level import statements
+        imports = list(_iter_module_imports(ctx.tree.body))
         
-        # Find import section
-        import_start = -1
-        import_end = -1
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith(('import ', 'from ')) and not stripped.startswith('#'):
-                if import_start == -1:
-                    import_start = i
-                import_end = i
-        
-        if import_start == -1:
+        if not imports:
             return issues  # No imports found
         
-        # Check for proper sectioning
-        import_lines = lines[import_start:import_end + 1]
+        import_start = imports[0].lineno - 1
+        import_end = imports[-1].end_lineno
         
-        # Look for section comments
-        has_stdlib_section = any("Standard library" in line for line in import_lines)
-        has_thirdparty_section = any("Third-party" in line for line in import_lines)
-        has_local_section = any("Local imports" in line for line in import_lines)
+        # Look for section comments within the import block
+        import_lines = ctx.lines[import_start:import_end]
         
-        if not (has_stdlib_section or has_thirdparty_section or has_local_section):
+        if not any(IMPORT_SECTION_REGEX.search(line) for line in import_lines):
             issues.append(CodeIssue(
                 str(file_path), import_start + 1, "imports",
                 "Imports should be organized in sections (Standard library, Third-party, Local)", "warning"
@@ -238,67 +414,41 @@ def check_imports_organization(file_path: Path) -> List[CodeIssue]:
     return issues
 
 
-def check_naming_conventions(file_path: Path) -> List[CodeIssue]:
+def check_naming_conventions(ctx: FileContext) -> List[CodeIssue]:
     """
     Check naming conventions according to IOE standards.
     
     Args:
-        file_path: Path to Python file
+        ctx: Shared file context
     
     Returns:
         List of issues found
     """
     issues = []
+    file_path = ctx.path
+    
+    if ctx.syntax_error is not None:
+        issues.append(CodeIssue(
+            str(file_path), ctx.syntax_error.lineno or 1, "syntax",
+            f"Syntax error: {ctx.syntax_error.msg}", "error"
+        ))
+        return issues
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        tree = ast.parse(content, str(file_path))
-        
-        for node in ast.walk(tree):
-            # Check class names
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                
-                # IOE classes should start with IOE
-                if not class_name.startswith('IOE') and not class_name.startswith('_'):
-                    issues.append(CodeIssue(
-                        str(file_path), node.lineno, "naming",
-                        f"Class '{class_name}' should follow IOE naming convention (start with 'IOE')", "warning"
-                    ))
-                elif class_name.startswith('IOE') and not re.match(IOE_PREFIX_PATTERNS['class'], class_name):
-                    issues.append(CodeIssue(
-                        str(file_path), node.lineno, "naming",
-                        f"Class '{class_name}' doesn't follow IOE class naming pattern", "warning"
-                    ))
-            
-            # Check function names
-            elif isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                
-                # Skip private and magic methods
-                if not func_name.startswith('_'):
-                    if not re.match(IOE_PREFIX_PATTERNS['function'], func_name):
-                        issues.append(CodeIssue(
-                            str(file_path), node.lineno, "naming",
-                            f"Function '{func_name}' should use snake_case naming", "info"
-                        ))
+        # Check class and function names
+        visitor = _NamingVisitor(str(file_path))
+        visitor.visit(ctx.tree)
+        issues.extend(visitor.issues)
         
         # Check module name
         module_name = file_path.stem
         if module_name != "__init__" and not module_name.startswith('test_'):
-            if not re.match(IOE_PREFIX_PATTERNS['module'], module_name) and module_name not in ['main', 'setup']:
+            if not IOE_PREFIX_PATTERNS['module'].match(module_name) and module_name not in ['main', 'setup']:
                 issues.append(CodeIssue(
                     str(file_path), 1, "naming",
                     f"Module '{module_name}' should follow IOE naming convention (start with 'ioe_')", "info"
                 ))
         
-    except SyntaxError as e:
-        issues.append(CodeIssue(
-            str(file_path), e.lineno or 1, "syntax",
-            f"Syntax error: {e.msg}", "error"
-        ))
     except Exception as e:
         issues.append(CodeIssue(
             str(file_path), 1, "naming",
@@ -308,37 +458,24 @@ def check_naming_conventions(file_path: Path) -> List[CodeIssue]:
     return issues
 
 
-def check_code_structure(file_path: Path) -> List[CodeIssue]:
+def check_code_structure(ctx: FileContext) -> List[CodeIssue]:
     """
     Check code structure and organization.
     
     Args:
-        file_path: Path to Python file
+        ctx: Shared file context
     
     Returns:
         List of issues found
     """
     issues = []
+    file_path = ctx.path
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Check for proper section comments
-        expected_sections = [
-            "Imports",
-            "Constants and Configuration", 
-            "Global Variables",
-            "Helper Functions",
-            "Main Functions"
-        ]
-        
-        found_sections = []
-        for i, line in enumerate(lines):
-            for section in expected_sections:
-                if section in line and line.strip().startswith('#'):
-                    found_sections.append(section)
-                    break
+        lines = ctx.lines
+        
+        # Check for proper section comments (one match per comment line)
+        found_sections = SECTION_COMMENT_REGEX.findall(ctx.text)
         
         # Check if main sections are present
         if len(found_sections) < 2:
@@ -348,11 +485,8 @@ def check_code_structure(file_path: Path) -> List[CodeIssue]:
             ))
         
         # Check for main execution guard
-        has_main_guard = any("if __name__ == \"__main__\":" in line for line in lines)
-        has_executable_code = any(not line.strip().startswith(('#', '"""', "'''")) and 
-                                line.strip() and 
-                                not line.strip().startswith(('import ', 'from '))
-                                for line in lines[-20:])  # Check last 20 lines
+        has_main_guard = MAIN_GUARD_REGEX.search(ctx.text) is not None
+        has_executable_code = EXECUTABLE_LINE_REGEX.search('\n'.join(lines[-20:])) is not None  # Check last 20 lines
         
         if has_executable_code and not has_main_guard:
             issues.append(CodeIssue(
@@ -369,6 +503,37 @@ def check_code_structure(file_path: Path) -> List[CodeIssue]:
     return issues
 
 
+def collect_file_stats(ctx: FileContext) -> FileStats:
+    """
+    Count lines, functions, classes and imports in a loaded file.
+    
+    Args:
+        ctx: Shared file context
+    
+    Returns:
+        Statistics for the file (AST counts are zero if it does not parse)
+    """
+    functions = classes = imports = 0
+    
+    if ctx.tree is not None:
+        for node in ast.walk(ctx.tree):
+            node_type = type(node)
+            if node_type is ast.FunctionDef:
+                functions += 1
+            elif node_type is ast.ClassDef:
+                classes += 1
+            elif node_type is ast.Import or node_type is ast.ImportFrom:
+                imports += 1
+    
+    return FileStats(
+        lines=ctx.text.count('\n') + 1,
+        functions=functions,
+        classes=classes,
+        imports=imports,
+        ioe_compliant=ctx.text.startswith('"""') and "IOE INNOVATION Team" in ctx.text
+    )
+
+
 def format_file_inplace(file_path: Path) -> List[str]:
     """
     Apply basic formatting fixes to file.
@@ -385,14 +550,10 @@ def format_file_inplace(file_path: Path) -> List[str]:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        original_content = content
-        
         # Fix trailing whitespace
-        lines = content.split('\n')
-        fixed_lines = [line.rstrip() for line in lines]
-        content = '\n'.join(fixed_lines)
+        content, replaced = TRAILING_WHITESPACE_REGEX.subn('', content)
         
-        if content != original_content:
+        if replaced:
             fixes.append("Removed trailing whitespace")
         
         # Ensure file ends with newline
@@ -410,6 +571,213 @@ def format_file_inplace(file_path: Path) -> List[str]:
     
     return fixes
 
+
+def check_file(file_path: Path, fix: bool = False,
+               data: Optional[bytes] = None) -> Tuple[List[CodeIssue], List[str]]:
+    """
+    Run all IOE checks on one file and optionally apply fixes.
+    
+    The file is read and parsed once; every check shares the result.
+    
+    Args:
+        file_path: Path to Python file
+        fix: Apply automatic fixes after checking
+        data: File contents if already read
+    
+    Returns:
+        Tuple of (issues found, fixes applied)
+    """
+    try:
+        ctx = load_file_context(file_path, data)
+    except (OSError, UnicodeDecodeError) as e:
+        issues = [CodeIssue(str(file_path), 1, "header", f"Error reading file: {e}", "error")]
+    else:
+        issues = []
+        issues.extend(check_file_header(ctx))
+        issues.extend(check_imports_organization(ctx))
+        issues.extend(check_naming_conventions(ctx))
+        issues.extend(check_code_structure(ctx))
+    
+    fixes = format_file_inplace(file_path) if fix else []
+    
+    return issues, fixes
+
+
+def iter_check_results(files: List[Path], fix: bool = False,
+                       jobs: int = 1) -> Iterator[Tuple[List[CodeIssue], List[str]]]:
+    """
+    Check files, spreading the work across processes when jobs > 1.
+    
+    Args:
+        files: Python files to check
+        fix: Apply automatic fixes after checking
+        jobs: Number of worker processes
+    
+    Returns:
+        Iterator of (issues, fixes) per file, in input order
+    """
+    if len(files) <= 1:
+        return (check_file(file_path, fix) for file_path in files)
+    
+    if jobs <= 1:
+        return _iter_check_results_read_ahead(files, fix)
+    
+    return _iter_check_results_parallel(files, fix, jobs)
+
+
+def _read_file_ahead(file_path: Path) -> Optional[bytes]:
+    """Read file bytes in a worker thread; None lets check_file re-read and report the error."""
+    try:
+        return file_path.read_bytes()
+    except OSError:
+        return None
+
+
+def _iter_check_results_read_ahead(files: List[Path], fix: bool) -> Iterator[Tuple[List[CodeIssue], List[str]]]:
+    """
+    Check files in this process while a thread pool reads upcoming files.
+    
+    At most READ_AHEAD_WINDOW files are read ahead, so the whole tree is
+    never held in memory at once.
+    """
+    with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as executor:
+        upcoming = iter(files)
+        pending = deque((file_path, executor.submit(_read_file_ahead, file_path))
+                        for file_path in islice(upcoming, READ_AHEAD_WINDOW))
+        
+        while pending:
+            file_path, future = pending.popleft()
+            next_path = next(upcoming, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(_read_file_ahead, next_path)))
+            yield check_file(file_path, fix, future.result())
+
+
+def _iter_check_results_parallel(files: List[Path], fix: bool,
+                                 jobs: int) -> Iterator[Tuple[List[CodeIssue], List[str]]]:
+    """Check files in a process pool, yielding results in input order."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(check_file, files, [fix] * len(files), chunksize=16)
+
+
+def write_json_report(report: Dict[str, Any]) -> None:
+    """
+    Write a JSON report with 2-space indentation to stdout.
+    
+    With orjson the encoded bytes go straight to the binary stdout buffer;
+    otherwise json.dump streams into the text stream. Neither path builds
+    an intermediate str of the whole report.
+    
+    Args:
+        report: JSON-serializable report
+    """
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    
+    if ORJSON_AVAILABLE and stdout_buffer is not None:
+        sys.stdout.flush()  # Keep earlier text output ahead of the raw bytes
+        stdout_buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        stdout_buffer.flush()
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+def load_check_cache(cache_dir: Path) -> Dict[str, Any]:
+    """
+    Load cached check results written by a previous run.
+    
+    Args:
+        cache_dir: Directory holding the cache file
+    
+    Returns:
+        Mapping of absolute file path to cache entry (empty if unusable)
+    """
+    try:
+        data = json.loads((cache_dir / CACHE_FILE_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    
+    # Results from another tool version may use different rules
+    if not isinstance(data, dict) or data.get("version") != TOOL_VERSION:
+        return {}
+    
+    return data.get("files", {})
+
+
+def save_check_cache(cache_dir: Path, entries: Dict[str, Any]) -> None:
+    """
+    Atomically write check results for the next run.
+    
+    Args:
+        cache_dir: Directory holding the cache file
+        entries: Mapping of absolute file path to cache entry
+    """
+    cache_path = cache_dir / CACHE_FILE_NAME
+    tmp_path = cache_dir / f"{CACHE_FILE_NAME}.tmp"
+    
+    try:
+        tmp_path.write_text(json.dumps({"version": TOOL_VERSION, "files": entries}), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best effort (e.g. read-only checkout)
+
+
+def iter_cached_check_results(files: List[Path], cache: Dict[str, Any],
+                              jobs: int = 1) -> Iterator[Tuple[List[CodeIssue], List[str]]]:
+    """
+    Check files, reusing cached issues for files whose (mtime, size) is unchanged.
+    
+    New results are written back into cache, and entries for files that no
+    longer exist are dropped from it.
+    
+    Args:
+        files: Python files to check
+        cache: Cache entries from load_check_cache (updated in place)
+        jobs: Number of worker processes
+    
+    Returns:
+        Iterator of (issues, fixes) per file, in input order
+    """
+    abs_paths = [os.path.abspath(file_path) for file_path in files]
+    cache_keys = []
+    stale_files = []
+    
+    for file_path, abs_path in zip(files, abs_paths):
+        try:
+            stat = os.stat(file_path)
+            cache_key = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            cache_key = None
+        
+        entry = cache.get(abs_path)
+        if cache_key is None or entry is None or entry.get("key") != cache_key:
+            stale_files.append(file_path)
+        cache_keys.append(cache_key)
+    
+    # Forget deleted files; entries outside this run's file list are only stat'ed
+    checked_paths = set(abs_paths)
+    for cached_path in [path for path in cache if path not in checked_paths and not os.path.exists(path)]:
+        del cache[cached_path]
+    
+    fresh_results = iter_check_results(stale_files, False, jobs)
+    
+    for file_path, abs_path, cache_key in zip(files, abs_paths, cache_keys):
+        entry = cache.get(abs_path)
+        
+        if cache_key is not None and entry is not None and entry.get("key") == cache_key:
+            # Report the path as given on this run, not the one stored with the entry
+            display_path = str(file_path)
+            yield [CodeIssue(display_path, *fields[1:]) for fields in entry["issues"]], []
+            continue
+        
+        issues, fixes = next(fresh_results)
+        if cache_key is not None:
+            cache[abs_path] = {
+                "key": cache_key,
+                "issues": [list(issue) for issue in issues]
+            }
+        yield issues, fixes
+
 #######################################################################################################################
 # Main CLI Commands
 #######################################################################################################################
@@ -431,7 +799,13 @@ def cli():
               type=click.Choice(['text', 'json']),
               default='text',
               help='Output format')
-def check(path: str, fix: bool, severity: str, output: str) -> None:
+@click.option('--jobs', '-j',
+              type=click.IntRange(min=1),
+              default=os.cpu_count() or 1,
+              show_default=True,
+              help='Number of worker processes')
+@click.option('--no-cache', is_flag=True, help=f'Ignore and do not update {CACHE_FILE_NAME}')
+def check(path: str, fix: bool, severity: str, output: str, jobs: int, no_cache: bool) -> None:
     """
     Check Python files for IOE coding standards compliance.
     
@@ -463,33 +837,48 @@ def check(path: str, fix: bool, severity: str, output: str) -> None:
         all_fixes = []
         
         # Process files
-        with Progress() as progress:
+        with Progress(refresh_per_second=5) as progress:
             task = progress.add_task("Checking files...", total=len(files_to_check))
             
-            for file_path in files_to_check:
-                # Check file
-                issues = []
-                issues.extend(check_file_header(file_path))
-                issues.extend(check_imports_organization(file_path))
-                issues.extend(check_naming_conventions(file_path))
-                issues.extend(check_code_structure(file_path))
-                
-                # Apply fixes if requested
-                if fix:
-                    fixes = format_file_inplace(file_path)
-                    if fixes:
-                        all_fixes.extend([(str(file_path), fix) for fix in fixes])
+            # Fixes rewrite files, so cached results only apply to read-only checks
+            use_cache = not (fix or no_cache)
+            cache_dir = path_obj if path_obj.is_dir() else path_obj.parent
+            
+            if use_cache:
+                cache = load_check_cache(cache_dir)
+                results = iter_cached_check_results(files_to_check, cache, jobs)
+            else:
+                results = iter_check_results(files_to_check, fix, jobs)
+            
+            severity_levels = {'error': 3, 'warning': 2, 'info': 1}
+            min_level = severity_levels[severity]
+            
+            for checked, (file_path, (issues, fixes)) in enumerate(zip(files_to_check, results), 1):
+                # Collect applied fixes
+                if fixes:
+                    all_fixes.extend([(str(file_path), fix_msg) for fix_msg in fixes])
                 
                 # Filter by severity
-                severity_levels = {'error': 3, 'warning': 2, 'info': 1}
-                min_level = severity_levels[severity]
                 filtered_issues = [
                     issue for issue in issues 
                     if severity_levels.get(issue.severity, 1) >= min_level
                 ]
                 
                 all_issues.extend(filtered_issues)
-                progress.update(task, advance=1)
+                
+                if checked % PROGRESS_BATCH_SIZE == 0:
+                    progress.update(task, advance=PROGRESS_BATCH_SIZE)
+            
+            progress.update(task, completed=len(files_to_check))
+            
+            if use_cache:
+                save_check_cache(cache_dir, cache)
+        
+        # Count issues per severity once for the summary and exit code
+        severity_counts = Counter(issue.severity for issue in all_issues)
+        error_count = severity_counts['error']
+        warning_count = severity_counts['warning']
+        info_count = severity_counts['info']
         
         # Output results
         if output == 'text':
@@ -498,22 +887,17 @@ def check(path: str, fix: bool, severity: str, output: str) -> None:
                 console.print(f"📋 Found {len(all_issues)} issues:", style="bold yellow")
                 console.print()
                 
-                # Group by severity
-                errors = [i for i in all_issues if i.severity == 'error']
-                warnings = [i for i in all_issues if i.severity == 'warning']
-                infos = [i for i in all_issues if i.severity == 'info']
-                
                 summary_table = Table(show_header=True, header_style="bold magenta")
                 summary_table.add_column("Severity", width=10)
                 summary_table.add_column("Count", width=8)
                 summary_table.add_column("Description", width=40)
                 
-                if errors:
-                    summary_table.add_row("ERROR", str(len(errors)), "Critical issues that must be fixed", style="red")
-                if warnings:
-                    summary_table.add_row("WARNING", str(len(warnings)), "Important issues to address", style="yellow")
-                if infos:
-                    summary_table.add_row("INFO", str(len(infos)), "Suggestions for improvement", style="cyan")
+                if error_count:
+                    summary_table.add_row("ERROR", str(error_count), "Critical issues that must be fixed", style="red")
+                if warning_count:
+                    summary_table.add_row("WARNING", str(warning_count), "Important issues to address", style="yellow")
+                if info_count:
+                    summary_table.add_row("INFO", str(info_count), "Suggestions for improvement", style="cyan")
                 
                 console.print(summary_table)
                 console.print()
@@ -534,14 +918,13 @@ def check(path: str, fix: bool, severity: str, output: str) -> None:
                     console.print(f"  {file_path}: {fix_msg}", style="green")
         
         else:  # JSON output
-            import json
             result = {
                 "summary": {
                     "total_files": len(files_to_check),
                     "total_issues": len(all_issues),
-                    "errors": len([i for i in all_issues if i.severity == 'error']),
-                    "warnings": len([i for i in all_issues if i.severity == 'warning']),
-                    "infos": len([i for i in all_issues if i.severity == 'info'])
+                    "errors": error_count,
+                    "warnings": warning_count,
+                    "infos": info_count
                 },
                 "issues": [
                     {
@@ -559,12 +942,12 @@ def check(path: str, fix: bool, severity: str, output: str) -> None:
                 ]
             }
             
-            print(json.dumps(result, indent=2))
+            write_json_report(result)
         
         # Exit with appropriate code
-        if any(issue.severity == 'error' for issue in all_issues):
+        if error_count:
             sys.exit(1)
-        elif any(issue.severity == 'warning' for issue in all_issues):
+        elif warning_count:
             sys.exit(2)
         else:
             sys.exit(0)
@@ -604,31 +987,15 @@ def stats(path: str) -> None:
         
         for file_path in files_to_analyze:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                
-                total_lines += len(lines)
-                
-                # Check IOE compliance
-                if content.startswith('"""') and "IOE INNOVATION Team" in content:
-                    ioe_compliant_files += 1
-                
-                # Parse AST
-                try:
-                    tree = ast.parse(content)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            total_functions += 1
-                        elif isinstance(node, ast.ClassDef):
-                            total_classes += 1
-                        elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                            total_imports += 1
-                except SyntaxError:
-                    pass  # Skip files with syntax errors
-                    
-            except Exception:
-                pass  # Skip files that can't be read
+                file_stats = collect_file_stats(load_file_context(file_path))
+            except (OSError, UnicodeDecodeError):
+                continue  # Skip files that can't be read
+            
+            total_lines += file_stats.lines
+            total_functions += file_stats.functions
+            total_classes += file_stats.classes
+            total_imports += file_stats.imports
+            ioe_compliant_files += file_stats.ioe_compliant
         
         # Display statistics
         console.print()
@@ -35,15 +35,17 @@ Notes:         Tool for generating new IOE Python projects
 import os
 import sys
 import shutil
+import string
+import hashlib
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party imports
+# rich is imported on first use, so --help/--version and quiet runs without warnings skip its import cost
 import click
-from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 
 #######################################################################################################################
 # Constants and Configuration
@@ -51,6 +53,9 @@ from rich.table import Table
 TOOL_VERSION = "1.0.0"
 TOOL_NAME = "IOE Project Generator"
 
+# Threads writing generated files once the directory tree exists
+FILE_WRITER_WORKERS = 4
+
 # Project templates
 PROJECT_TYPES = {
     "web_app": "Flask/FastAPI web application",
@@ -61,81 +66,86 @@ PROJECT_TYPES = {
     "generic": "Generic Python project"
 }
 
-#######################################################################################################################
-# Global Variables
-#######################################################################################################################
-console = Console()
-
-#######################################################################################################################
-# Helper Functions
-#######################################################################################################################
-def create_directory_structure(project_path: Path, project_type: str) -> None:
-    """
-    Create project directory structure.
-    
-    Args:
-        project_path: Path to project root
-        project_type: Type of project to create
-    """
-    directories = [
-        "modules",
-        "modules/utils",
-        "tests",
-        "tests/test_modules",
-        "tests/test_integration",
-        "docs",
-        "examples",
-        "templates",
-        "tools",
-        "config",
-        "logs"
-    ]
-    
-    # Add project-specific directories
-    if project_type == "ai_model":
-        directories.extend(["data", "data/raw", "data/processed", "models", "notebooks"])
-    elif project_type == "web_app":
-        directories.extend(["static", "static/css", "static/js", "templates/html"])
-    elif project_type == "data_processing":
-        directories.extend(["data", "data/input", "data/output", "workflows"])
-    
-    for directory in directories:
-        dir_path = project_path / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
-        console.print(f"  ✓ Created directory: {directory}", style="green")
+# Sentinel holding the hash of the inputs a project was generated from
+GENERATION_CACHE_FILE = ".ioe-cache"
+
+# Characters replaced by '_' in project directory names
+DIR_NAME_TRANSLATION = str.maketrans(' -', '__')
+
+# Directories created for every project (parents listed before children)
+BASE_DIRECTORIES = (
+    "modules",
+    "modules/utils",
+    "tests",
+    "tests/test_modules",
+    "tests/test_integration",
+    "docs",
+    "examples",
+    "templates",
+    "tools",
+    "config",
+    "logs"
+)
+
+# Full directory list per project type (unknown types get BASE_DIRECTORIES)
+PROJECT_DIRECTORIES = {
+    project_type: BASE_DIRECTORIES + extra_directories
+    for project_type, extra_directories in {
+        "ai_model": ("data", "data/raw", "data/processed", "models", "notebooks"),
+        "web_app": ("static", "static/css", "static/js", "templates/html"),
+        "data_processing": ("data", "data/input", "data/output", "workflows")
+    }.items()
+}
 
+# Empty package markers created in every project
+INIT_FILES = (
+    "modules/__init__.py",
+    "modules/utils/__init__.py",
+    "tests/__init__.py",
+    "tests/test_modules/__init__.py",
+    "tests/test_integration/__init__.py"
+)
+
+# Requirements for every project
+BASE_REQUIREMENTS = (
+    "click>=8.0.0",
+    "rich>=10.0.0",
+    "pyyaml>=5.4.0"
+)
+
+# Full requirements list per project type (unknown types get BASE_REQUIREMENTS)
+PROJECT_REQUIREMENTS = {
+    project_type: BASE_REQUIREMENTS + extra_requirements
+    for project_type, extra_requirements in {
+        "web_app": ("flask>=2.0.0", "requests>=2.25.0"),
+        "ai_model": ("numpy>=1.21.0", "pandas>=1.3.0", "scikit-learn>=0.24.0", "matplotlib>=3.4.0"),
+        "api_server": ("fastapi>=0.68.0", "uvicorn>=0.15.0", "pydantic>=1.8.0"),
+        "data_processing": ("pandas>=1.3.0", "numpy>=1.21.0")
+    }.items()
+}
 
-def generate_main_py(project_path: Path, project_name: str, project_type: str, author: str) -> None:
-    """
-    Generate main.py file for the project.
-    
-    Args:
-        project_path: Path to project root
-        project_name: Name of the project
-        project_type: Type of project
-        author: Author name
-    """
-    template_content = f'''"""
+# File templates, parsed once at import and filled in per project
+MAIN_PY_TEMPLATE = string.Template('''"""
 *******************************************************************************************************************
 General Information
 ********************************************************************************************************************
-Project:       {project_name}
+Project:       $project_name
 File:          main.py
 Description:   Main application entry point following IOE INNOVATION Team standards
 
-Author:        {author} (Project Leader)
+Author:        $author (Project Leader)
 Email:         [EMAIL_ADDRESS]
-Created:       {datetime.now().strftime('%Y-%m-%d')}
-Last Update:   {datetime.now().strftime('%Y-%m-%d')}
+Created:       $date
+Last Update:   $date
 Version:       1.0.0
 
 Python:        3.8+
 Dependencies:  [LIST_DEPENDENCIES]
 
-Copyright:     (c) {datetime.now().year} IOE INNOVATION Team
+Copyright:     (c) $year IOE INNOVATION Team
 License:       MIT
 
-Notes:         Main application orchestrator for {project_type}
+Notes:         Main application orchestrator for $project_type
                - Only Project Leader has permission to modify this file
                - Coordinates between different modules
                - Handles application lifecycle and configuration
@@ -163,9 +173,9 @@ from modules.utils.config import ConfigManager
 #######################################################################################################################
 # Constants and Configuration
 #######################################################################################################################
-APP_NAME = "{project_name}"
+APP_NAME = "$project_name"
 APP_VERSION = "1.0.0"
-APP_DESCRIPTION = "{PROJECT_TYPES.get(project_type, 'IOE Python Application')}"
+APP_DESCRIPTION = "$app_description"
 
 #######################################################################################################################
 # Global Variables
@@ -181,17 +191,17 @@ console = Console()
 @click.option('--debug', '-d', is_flag=True, help='Enable debug mode')
 def main(config: str, debug: bool) -> None:
     """
-    {project_name} - {PROJECT_TYPES.get(project_type, 'IOE Python Application')}
+    $project_name - $app_description
     
     Main entry point for IOE INNOVATION Team Python application.
     """
     try:
         # Print application banner
-        console.print(f"🚀 Starting {{APP_NAME}} v{{APP_VERSION}}", style="bold blue")
+        console.print(f"🚀 Starting {APP_NAME} v{APP_VERSION}", style="bold blue")
         
         # Initialize logging
         logger = LoggerManager(APP_NAME, level="DEBUG" if debug else "INFO")
-        logger.info(f"Starting {{APP_NAME}} application")
+        logger.info(f"Starting {APP_NAME} application")
         
         # Load configuration
         app_config = ConfigManager(config)
@@ -202,7 +212,7 @@ def main(config: str, debug: bool) -> None:
         logger.info("Application startup completed")
         
     except Exception as e:
-        console.print(f"❌ Fatal error: {{e}}", style="bold red")
+        console.print(f"❌ Fatal error: {e}", style="bold red")
         if debug:
             console.print_exception()
         sys.exit(1)
@@ -214,76 +224,12 @@ if __name__ == "__main__":
     main()
 
 # End of File
-'''
-    
-    main_file = project_path / "main.py"
-    with open(main_file, "w", encoding="utf-8") as f:
-        f.write(template_content)
-    
-    console.print("  ✓ Generated main.py", style="green")
-
-
-def generate_requirements_txt(project_path: Path, project_type: str) -> None:
-    """
-    Generate requirements.txt file.
-    
-    Args:
-        project_path: Path to project root
-        project_type: Type of project
-    """
-    base_requirements = [
-        "click>=8.0.0",
-        "rich>=10.0.0",
-        "pyyaml>=5.4.0"
-    ]
-    
-    # Add project-specific requirements
-    if project_type == "web_app":
-        base_requirements.extend([
-            "flask>=2.0.0",
-            "requests>=2.25.0"
-        ])
-    elif project_type == "ai_model":
-        base_requirements.extend([
-            "numpy>=1.21.0",
-            "pandas>=1.3.0",
-            "scikit-learn>=0.24.0",
-            "matplotlib>=3.4.0"
-        ])
-    elif project_type == "api_server":
-        base_requirements.extend([
-            "fastapi>=0.68.0",
-            "uvicorn>=0.15.0",
-            "pydantic>=1.8.0"
-        ])
-    elif project_type == "data_processing":
-        base_requirements.extend([
-            "pandas>=1.3.0",
-            "numpy>=1.21.0"
-        ])
-    
-    requirements_file = project_path / "requirements.txt"
-    with open(requirements_file, "w", encoding="utf-8") as f:
-        for req in base_requirements:
-            f.write(f"{req}\\n")
-    
-    console.print("  ✓ Generated requirements.txt", style="green")
-
+''')
 
-def generate_readme(project_path: Path, project_name: str, project_type: str, author: str) -> None:
-    """
-    Generate README.md file.
-    
-    Args:
-        project_path: Path to project root
-        project_name: Name of the project
-        project_type: Type of project
-        author: Author name
-    """
-    readme_content = f'''# {project_name}
+README_TEMPLATE = string.Template('''# $project_name
 
 ## Tổng quan
-{PROJECT_TYPES.get(project_type, 'Python application')} được phát triển theo tiêu chuẩn IOE INNOVATION Team.
+$project_description được phát triển theo tiêu chuẩn IOE INNOVATION Team.
 
 ## Cài đặt
 
@@ -312,7 +258,7 @@ python main.py --debug    # Chế độ debug
 ## Cấu trúc dự án
 
 ```
-{project_name.lower().replace(' ', '_')}/
+$tree_name/
 ├── main.py                 # Ứng dụng chính
 ├── requirements.txt        # Python dependencies
 ├── modules/               # Modules và packages
@@ -336,7 +282,7 @@ python tools/format_check.py --format
 ```
 
 ## Tác giả
-- **{author}** - *Project Leader*
+- **$author** - *Project Leader*
 - **IOE INNOVATION Team**
 
 ## License
@@ -344,23 +290,10 @@ MIT License - xem file LICENSE để biết thêm chi tiết.
 
 ---
 *Dự án được phát triển theo tiêu chuẩn IOE INNOVATION Team*
-'''
-    
-    readme_file = project_path / "README.md"
-    with open(readme_file, "w", encoding="utf-8") as f:
-        f.write(readme_content)
-    
-    console.print("  ✓ Generated README.md", style="green")
-
+''')
 
-def generate_gitignore(project_path: Path) -> None:
-    """
-    Generate .gitignore file.
-    
-    Args:
-        project_path: Path to project root
-    """
-    gitignore_content = '''# IOE Python Project - .gitignore
+# Static .gitignore, encoded once since it has no placeholders
+GITIGNORE_BYTES = '''# IOE Python Project - .gitignore
 
 # Byte-compiled / optimized / DLL files
 __pycache__/
@@ -407,13 +340,196 @@ data/raw/
 data/processed/
 models/*.pkl
 models/*.h5
-'''
+
+# IOE generator sentinel and tool caches
+.ioe-cache
+.ioe_format_cache.json
+.ioe_analysis_cache.json
+'''.encode("utf-8")
+
+#######################################################################################################################
+# Global Variables
+#######################################################################################################################
+console = None  # rich Console, created by get_console()
+
+#######################################################################################################################
+# Helper Functions
+#######################################################################################################################
+def make_project_dir_name(project_name: str) -> str:
+    """
+    Convert a project name into its directory name.
+    
+    Args:
+        project_name: Name of the project
+    
+    Returns:
+        Lowercase name with spaces and dashes replaced by underscores
+    """
+    return project_name.lower().translate(DIR_NAME_TRANSLATION)
+
+
+def get_console() -> Any:
+    """
+    Return the shared rich Console, importing rich on first use.
     
-    gitignore_file = project_path / ".gitignore"
-    with open(gitignore_file, "w", encoding="utf-8") as f:
-        f.write(gitignore_content)
+    Returns:
+        Console instance
+    """
+    global console
+    
+    if console is None:
+        from rich.console import Console
+        console = Console()
+    
+    return console
+
+
+def compute_generation_key(project_name: str, project_type: str, author: str) -> str:
+    """
+    Hash the generator inputs that determine the generated files.
     
-    console.print("  ✓ Generated .gitignore", style="green")
+    Args:
+        project_name: Name of the project
+        project_type: Type of project
+        author: Author name
+    
+    Returns:
+        Hex digest identifying this generator version and inputs
+    """
+    key_source = f"{TOOL_VERSION}|{project_name}|{project_type}|{author}"
+    return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def read_generation_key(project_root: str) -> Optional[str]:
+    """
+    Read the generation key stored in a project, if any.
+    
+    Args:
+        project_root: Path to project root
+    
+    Returns:
+        Stored key, or None if the sentinel is missing or unreadable
+    """
+    try:
+        with open(os.path.join(project_root, GENERATION_CACHE_FILE), "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def create_directory_structure(project_path: Path, project_type: str) -> Tuple[str, ...]:
+    """
+    Create project directory structure.
+    
+    Args:
+        project_path: Path to project root
+        project_type: Type of project to create
+    
+    Returns:
+        Directories created, relative to the project root
+    """
+    project_root = os.fspath(project_path)
+    os.makedirs(project_root, exist_ok=True)
+    
+    directories = PROJECT_DIRECTORIES.get(project_type, BASE_DIRECTORIES)
+    
+    # Parents come first in the list, so each directory needs a single mkdir
+    for directory in directories:
+        try:
+            os.mkdir(os.path.join(project_root, directory))
+        except FileExistsError:
+            pass
+    
+    return directories
+
+
+def generate_main_py(project_path: Path, project_name: str, project_type: str, author: str,
+                     created: Optional[datetime] = None) -> None:
+    """
+    Generate main.py file for the project.
+    
+    Args:
+        project_path: Path to project root
+        project_name: Name of the project
+        project_type: Type of project
+        author: Author name
+        created: Creation timestamp for the header (default: now)
+    """
+    if created is None:
+        created = datetime.now()
+    
+    template_content = MAIN_PY_TEMPLATE.substitute(
+        project_name=project_name,
+        author=author,
+        date=created.strftime('%Y-%m-%d'),
+        year=created.year,
+        project_type=project_type,
+        app_description=PROJECT_TYPES.get(project_type, 'IOE Python Application')
+    )
+    
+    # Encode once and write raw bytes in a single call, bypassing the text layer
+    (project_path / "main.py").write_bytes(template_content.encode("utf-8"))
+
+
+def generate_requirements_txt(project_path: Path, project_type: str) -> None:
+    """
+    Generate requirements.txt file.
+    
+    Args:
+        project_path: Path to project root
+        project_type: Type of project
+    """
+    requirements = PROJECT_REQUIREMENTS.get(project_type, BASE_REQUIREMENTS)
+    
+    (project_path / "requirements.txt").write_bytes(("\n".join(requirements) + "\n").encode("utf-8"))
+
+
+def generate_readme(project_path: Path, project_name: str, project_type: str, author: str,
+                    project_dir_name: Optional[str] = None) -> None:
+    """
+    Generate README.md file.
+    
+    Args:
+        project_path: Path to project root
+        project_name: Name of the project
+        project_type: Type of project
+        author: Author name
+        project_dir_name: Directory name shown in the structure tree (default: derived from project_name)
+    """
+    if project_dir_name is None:
+        project_dir_name = make_project_dir_name(project_name)
+    
+    readme_content = README_TEMPLATE.substitute(
+        project_name=project_name,
+        project_description=PROJECT_TYPES.get(project_type, 'Python application'),
+        tree_name=project_dir_name,
+        author=author
+    )
+    
+    (project_path / "README.md").write_bytes(readme_content.encode("utf-8"))
+
+
+def generate_gitignore(project_path: Path) -> None:
+    """
+    Generate .gitignore file.
+    
+    Args:
+        project_path: Path to project root
+    """
+    (project_path / ".gitignore").write_bytes(GITIGNORE_BYTES)
+
+
+def create_init_files(project_root: str) -> None:
+    """
+    Create empty __init__.py files for the project packages.
+    
+    Args:
+        project_root: Path to project root
+    """
+    # Create empty files without the extra utime call of Path.touch()
+    for init_file in INIT_FILES:
+        init_path = os.path.join(project_root, init_file)
+        os.close(os.open(init_path, os.O_CREAT | os.O_WRONLY, 0o644))
 
 #######################################################################################################################
 # Main CLI Command
@@ -421,106 +537,147 @@ models/*.h5
 @click.command()
 @click.version_option(version=TOOL_VERSION, prog_name=TOOL_NAME)
 @click.option('--project-name', '-n', 
+              envvar='IOE_PROJECT_NAME',
               prompt='Project name',
-              help='Name of the project to create')
+              help='Name of the project to create (env: IOE_PROJECT_NAME)')
 @click.option('--project-type', '-t',
               type=click.Choice(list(PROJECT_TYPES.keys())),
               default='generic',
               help='Type of project to create')
 @click.option('--author', '-a',
+              envvar='IOE_AUTHOR',
               prompt='Author name',
-              help='Project author name')
+              help='Project author name (env: IOE_AUTHOR)')
 @click.option('--output-dir', '-o',
               default='.',
               help='Output directory for project')
 @click.option('--force', '-f',
               is_flag=True,
-              help='Overwrite existing project directory')
-def main(project_name: str, project_type: str, author: str, output_dir: str, force: bool) -> None:
+              help='Overwrite generated files in an existing project directory')
+@click.option('--clean',
+              is_flag=True,
+              help='Remove an existing project directory before generating')
+@click.option('--quiet', '-q',
+              is_flag=True,
+              help='Only print warnings and errors')
+def main(project_name: str, project_type: str, author: str, output_dir: str,
+         force: bool, clean: bool, quiet: bool) -> None:
     """
     IOE Project Generator - Create new Python projects following IOE standards.
     
     This tool generates a complete project structure with proper IOE INNOVATION Team
     coding standards, including templates, configuration files, and documentation.
     """
+    # Quiet runs only import rich when they have a warning or error to print
+    console = None if quiet else get_console()
+    
     try:
-        # Print banner
-        console.print()
-        console.print("=" * 70, style="blue")
-        console.print(f"  {TOOL_NAME} v{TOOL_VERSION}", style="bold blue")
-        console.print("  IOE INNOVATION Team", style="green")
-        console.print("=" * 70, style="blue")
-        console.print()
-        
-        # Show project information
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Key", style="cyan", width=15)
-        table.add_column("Value", style="white")
-        
-        table.add_row("Project Name", project_name)
-        table.add_row("Project Type", f"{project_type} ({PROJECT_TYPES[project_type]})")
-        table.add_row("Author", author)
-        table.add_row("Output Dir", output_dir)
+        project_description = PROJECT_TYPES[project_type]
+        created = datetime.now()
         
-        console.print(table)
-        console.print()
+        if not quiet:
+            from rich.console import Group
+            from rich.text import Text
+            
+            # Project information as fixed-width key/value lines (no table layout pass)
+            project_info = [
+                ("Project Name", project_name),
+                ("Project Type", f"{project_type} ({project_description})"),
+                ("Author", author),
+                ("Output Dir", output_dir)
+            ]
+            
+            # Render banner and project information in one print
+            console.print(Group(
+                Text(),
+                Text("=" * 70, style="blue"),
+                Text(f"  {TOOL_NAME} v{TOOL_VERSION}", style="bold blue"),
+                Text("  IOE INNOVATION Team", style="green"),
+                Text("=" * 70, style="blue"),
+                Text(),
+                *(Text.assemble((f"  {key:<15}", "cyan"), "    ", (value, "white")) for key, value in project_info),
+                Text()
+            ))
         
         # Create project directory
-        project_dir_name = project_name.lower().replace(' ', '_').replace('-', '_')
+        project_dir_name = make_project_dir_name(project_name)
         project_path = Path(output_dir) / project_dir_name
+        project_root = os.fspath(project_path)
+        generation_key = compute_generation_key(project_name, project_type, author)
         
-        if project_path.exists():
-            if not force:
-                console.print(f"❌ Project directory already exists: {project_path}", style="red")
-                console.print("Use --force to overwrite", style="yellow")
+        if os.path.exists(project_root):
+            if not (force or clean) and read_generation_key(project_root) == generation_key:
+                # Same generator version and inputs: the files would be regenerated unchanged
+                get_console().print(f"✅ Project is up to date: {project_path}", style="green")
                 return
+            elif clean:
+                get_console().print(f"⚠️ Removing existing project: {project_path}", style="yellow")
+                # rmtree refuses a symlinked project path instead of emptying its target
+                shutil.rmtree(project_root)
+            elif force:
+                # Generated files are truncated on write and existing directories
+                # are kept, so only the files written below are touched
+                get_console().print(f"⚠️ Overwriting existing project: {project_path}", style="yellow")
             else:
-                console.print(f"⚠️ Overwriting existing project: {project_path}", style="yellow")
-                shutil.rmtree(project_path)
+                get_console().print(f"❌ Project directory already exists: {project_path}", style="red")
+                get_console().print("Use --force to overwrite or --clean to recreate", style="yellow")
+                return
         
         # Generate project with progress
-        with Progress() as progress:
-            task = progress.add_task("Generating project...", total=6)
+        # No live progress bar (or its refresh thread, or the rich.progress import) when output is piped
+        if quiet or not console.is_terminal:
+            progress_context = nullcontext(None)
+        else:
+            from rich.progress import Progress
+            progress_context = Progress(console=console)
+        
+        with progress_context as progress:
+            task = progress.add_task("Generating project...", total=6) if progress else None
             
             # Create directory structure
-            console.print("📁 Creating directory structure...")
-            create_directory_structure(project_path, project_type)
-            progress.update(task, advance=1)
-            
-            # Generate main files
-            console.print("📄 Generating main.py...")
-            generate_main_py(project_path, project_name, project_type, author)
-            progress.update(task, advance=1)
-            
-            # Generate requirements
-            console.print("📋 Generating requirements.txt...")
-            generate_requirements_txt(project_path, project_type)
-            progress.update(task, advance=1)
-            
-            # Generate README
-            console.print("📖 Generating README.md...")
-            generate_readme(project_path, project_name, project_type, author)
-            progress.update(task, advance=1)
+            if not quiet:
+                console.print("📁 Creating directory structure...")
+            directories = create_directory_structure(project_path, project_type)
+            if not quiet:
+                # Report all directories in one styled print
+                console.print("\n".join(f"  ✓ Created directory: {directory}" for directory in directories),
+                              style="green")
+            if progress:
+                progress.update(task, advance=1)
             
-            # Generate .gitignore
-            console.print("🚫 Generating .gitignore...")
-            generate_gitignore(project_path)
-            progress.update(task, advance=1)
-            
-            # Create empty __init__.py files
-            console.print("🐍 Creating __init__.py files...")
-            init_files = [
-                project_path / "modules" / "__init__.py",
-                project_path / "modules" / "utils" / "__init__.py",
-                project_path / "tests" / "__init__.py",
-                project_path / "tests" / "test_modules" / "__init__.py",
-                project_path / "tests" / "test_integration" / "__init__.py"
+            # Generated files are independent, so write them concurrently
+            # and report each step in order as it completes
+            generation_steps = [
+                ("📄 Generating main.py...", "main.py",
+                 generate_main_py, (project_path, project_name, project_type, author, created)),
+                ("📋 Generating requirements.txt...", "requirements.txt",
+                 generate_requirements_txt, (project_path, project_type)),
+                ("📖 Generating README.md...", "README.md",
+                 generate_readme, (project_path, project_name, project_type, author, project_dir_name)),
+                ("🚫 Generating .gitignore...", ".gitignore",
+                 generate_gitignore, (project_path,)),
+                ("🐍 Creating __init__.py files...", None,
+                 create_init_files, (project_root,))
             ]
             
-            for init_file in init_files:
-                init_file.touch()
-            
-            progress.update(task, advance=1)
+            with ThreadPoolExecutor(max_workers=FILE_WRITER_WORKERS) as executor:
+                futures = [executor.submit(step, *args) for _, _, step, args in generation_steps]
+                
+                for (message, generated_file, _, _), future in zip(generation_steps, futures):
+                    if not quiet:
+                        console.print(message)
+                    future.result()
+                    if generated_file and not quiet:
+                        console.print(f"  ✓ Generated {generated_file}", style="green")
+                    if progress:
+                        progress.update(task, advance=1)
+        
+        # Record the inputs so an identical re-run can be skipped
+        with open(os.path.join(project_root, GENERATION_CACHE_FILE), "w", encoding="utf-8") as f:
+            f.write(generation_key)
+        
+        if quiet:
+            return
         
         # Success message
         console.print()
@@ -530,15 +687,16 @@ def main(project_name: str, project_type: str, author: str, output_dir: str, for
         
         # Next steps
         console.print("📋 Next steps:", style="bold yellow")
-        console.print(f"  1. cd {project_dir_name}")
-        console.print("  2. python -m venv venv")
-        console.print("  3. source venv/bin/activate  # Linux/Mac")
-        console.print("  4. pip install -r requirements.txt")
-        console.print("  5. python main.py")
-        console.print()
+        console.print(
+            f"  1. cd {project_dir_name}\n"
+            "  2. python -m venv venv\n"
+            "  3. source venv/bin/activate  # Linux/Mac\n"
+            "  4. pip install -r requirements.txt\n"
+            "  5. python main.py\n"
+        )
         
     except Exception as e:
-        console.print(f"❌ Error generating project: {e}", style="bold red")
+        get_console().print(f"❌ Error generating project: {e}", style="bold red")
         sys.exit(1)
 
 #######################################################################################################################
@@ -39,11 +39,17 @@ import ast
 import sys
 import json
 import re
+import gzip
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Set
+from typing import Dict, List, Tuple, Optional, Any, Set, Iterator, Callable, TypeVar
 from dataclasses import dataclass
-from collections import defaultdict, Counter
+from collections import Counter
 from datetime import datetime
+from bisect import bisect_right
+from itertools import accumulate, groupby
+from functools import lru_cache, partial, cached_property
+from enum import IntFlag
+from concurrent.futures import ProcessPoolExecutor
 
 # Third-party imports
 import click
@@ -52,6 +58,13 @@ from rich.table import Table
 from rich.progress import Progress
 from rich.tree import Tree
 
+# Third-party imports (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 #######################################################################################################################
 # Constants and Configuration
 #######################################################################################################################
@@ -67,8 +80,21 @@ COMPLEXITY_THRESHOLDS = {
     'cyclomatic_complexity': 10
 }
 
+# Suggestion texts, shared as single string objects by every result
+SUGGESTIONS = {
+    'complexity': 'Consider breaking down complex functions into smaller ones',
+    'nesting': 'Reduce nesting depth by extracting functions or using early returns',
+    'function_length': 'Consider breaking long functions into smaller, focused functions',
+    'function_docs': 'Add docstrings to functions for better documentation',
+    'class_docs': 'Add docstrings to classes for better documentation'
+}
+
+# Directory names skipped (with everything below them) when searching for files
+EXCLUDED_DIR_NAMES = frozenset({'__pycache__', '.venv', 'venv', '.git', 'build', 'dist'})
+
 # Security patterns to detect
-SECURITY_PATTERNS = [
+# Patterns are compiled once here instead of on every line of every file
+SECURITY_PATTERNS = [(re.compile(pattern, re.IGNORECASE), message) for pattern, message in [
     (r'eval\s*\(', 'Use of eval() can be dangerous'),
     (r'exec\s*\(', 'Use of exec() can be dangerous'),
     (r'subprocess\.call\s*\([^)]*shell\s*=\s*True', 'Shell=True in subprocess can be risky'),
@@ -77,7 +103,96 @@ SECURITY_PATTERNS = [
     (r'request\.args\.get\([^)]*\)', 'Direct use of request parameters without validation'),
     (r'sql.*%.*%', 'Possible SQL injection vulnerability'),
     (r'os\.system\s*\(', 'Use of os.system() can be dangerous')
-]
+]]
+
+# Literal text (casefolded) that every security pattern match contains; files
+# without any of it skip the regex scan entirely
+SECURITY_HINTS = ('eval', 'exec', 'subprocess.call', 'pickle.load', 'yaml.load',
+                  'request.args.get', 'sql', 'os.system')
+
+# All security patterns fused into one alternation, used to find candidate lines
+SECURITY_REGEX = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern, _ in SECURITY_PATTERNS), re.IGNORECASE
+)
+
+# Files handed to each worker process per round trip
+ANALYSIS_CHUNK_SIZE = 8
+
+# Distinct file contents per process whose AST metrics are kept for reuse
+SOURCE_METRICS_CACHE_SIZE = 2048
+
+# Per-directory cache of analysis results, keyed by file mtime and size
+CACHE_FILE_NAME = ".ioe_analysis_cache.json"
+
+ResultT = TypeVar('ResultT')
+
+# Write buffer for report files, large enough to hold a typical report in one flush
+REPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Report files ending in this suffix are written gzip-compressed; the fast level suits repetitive HTML
+GZIP_REPORT_SUFFIX = '.gz'
+GZIP_REPORT_COMPRESS_LEVEL = 4
+
+# HTML special characters, escaped in one C-level pass with str.translate
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# Issue severity ranks; unknown severities rank as info
+SEVERITY_LEVELS = {'info': 1, 'warning': 2, 'error': 3}
+
+# Per-file, per-severity-group and per-issue HTML fragments, %-formatted while rendering
+HTML_FILE_TEMPLATE = """
+        <div class="file">
+            <h3>%s</h3>
+        """
+HTML_ISSUE_GROUP_TEMPLATE = '<div class="issue-group %s">'
+HTML_ISSUE_TEMPLATE = '<div class="issue">%s</div>'
+
+# Static <head> of the HTML report (document type, title and CSS), built once at import
+HTML_REPORT_HEAD = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>IOE Static Analysis Report</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .header { background: #2196F3; color: white; padding: 20px; }
+            .summary { background: #f5f5f5; padding: 15px; margin: 20px 0; }
+            .file { border: 1px solid #ddd; margin: 10px 0; padding: 15px; }
+            .issue { margin: 5px 0; padding: 5px; }
+            .issue-group { margin: 5px 0; }
+            .error { background: #ffebee; border-left: 4px solid #f44336; }
+            .warning { background: #fff3e0; border-left: 4px solid #ff9800; }
+            .info { background: #e3f2fd; border-left: 4px solid #2196f3; }
+        </style>
+    </head>
+"""
+
+# Report header and summary; only the timestamp, file count and severity are filled in per report
+HTML_REPORT_SUMMARY_TEMPLATE = f"""    <body>
+        <div class="header">
+            <h1>{TOOL_NAME} Report</h1>
+            <p>Generated on %s</p>
+        </div>
+        
+        <div class="summary">
+            <h2>Summary</h2>
+            <p>Total files analyzed: %d</p>
+            <p>Minimum severity: %s</p>
+        </div>
+        
+        <h2>Files</h2>
+    """
+
+HTML_REPORT_FOOT = """
+    </body>
+    </html>
+    """
 
 #######################################################################################################################
 # Global Variables
@@ -90,11 +205,31 @@ console = Console()
 @dataclass
 class AnalysisResult:
     """Represents analysis result for a file or project."""
-    file_path: str
+    file_path: Path
     issues: List[Dict[str, Any]]
     metrics: Dict[str, Any]
     suggestions: List[str]
 
+class Analyses(IntFlag):
+    """Sub-analyses run by analyze_file; unrequested ones are skipped entirely."""
+    COMPLEXITY = 1
+    SECURITY = 2
+    DOCUMENTATION = 4
+    DEPENDENCIES = 8
+    ALL = COMPLEXITY | SECURITY | DOCUMENTATION | DEPENDENCIES
+
+@dataclass
+class FileContext:
+    """File content shared by all analyses of one file."""
+    path: Path
+    content: str
+    lines: List[str]
+    
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset of each line in content, built on first use by a line-based pass."""
+        return list(accumulate((len(line) + 1 for line in self.lines[:-1]), initial=0))
+
 @dataclass
 class ComplexityMetrics:
     """Code complexity metrics."""
@@ -109,7 +244,12 @@ class ComplexityMetrics:
 # Helper Classes
 #######################################################################################################################
 class ComplexityAnalyzer(ast.NodeVisitor):
-    """AST visitor for calculating code complexity."""
+    """AST visitor for calculating complexity, documentation and import data in one walk."""
+    
+    # Node types that add a decision point, and node types that open a nesting level
+    DECISION_NODES = frozenset({ast.If, ast.While, ast.For, ast.Try, ast.ExceptHandler})
+    NESTING_NODES = frozenset({ast.If, ast.While, ast.For, ast.Try,
+                               ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef})
     
     def __init__(self):
         self.complexity = 0
@@ -120,75 +260,76 @@ class ComplexityAnalyzer(ast.NodeVisitor):
         self.lines_of_code = 0
         self.function_lengths = []
         self.current_function_lines = 0
+        self.total_functions = 0
+        self.documented_functions = 0
+        self.total_classes = 0
+        self.documented_classes = 0
+        self.imports = set()
+    
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node, driven by the node-type tables instead of per-type visit_* methods."""
+        node_type = type(node)
         
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
+        recorder = self._RECORDERS.get(node_type)
+        if recorder is not None:
+            recorder(self, node)
+        
+        if node_type in self.DECISION_NODES:
+            self.complexity += 1
+        
+        if node_type in self.NESTING_NODES:
+            self.nesting_depth += 1
+            if self.nesting_depth > self.max_nesting_depth:
+                self.max_nesting_depth = self.nesting_depth
+            
+            self.generic_visit(node)
+            self.nesting_depth -= 1
+        else:
+            self.generic_visit(node)
+    
+    def _record_function(self, node: ast.FunctionDef) -> None:
+        """Record function definition."""
+        # Documentation coverage only counts plain (non-async) functions
+        self.total_functions += 1
+        if ast.get_docstring(node):
+            self.documented_functions += 1
+        
+        self._record_any_function(node)
+    
+    def _record_any_function(self, node: ast.AST) -> None:
+        """Record complexity data shared by sync and async functions."""
         self.function_count += 1
         
         # Calculate function length
         if hasattr(node, 'end_lineno') and node.end_lineno:
             func_length = node.end_lineno - node.lineno + 1
             self.function_lengths.append(func_length)
-        
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
-    
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit async function definition."""
-        self.visit_FunctionDef(node)
     
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition."""
+    def _record_class(self, node: ast.ClassDef) -> None:
+        """Record class definition."""
         self.class_count += 1
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+        self.total_classes += 1
+        if ast.get_docstring(node):
+            self.documented_classes += 1
     
-    def visit_If(self, node: ast.If) -> None:
-        """Visit if statement."""
-        self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+    def _record_import(self, node: ast.Import) -> None:
+        """Record import statement."""
+        for alias in node.names:
+            self.imports.add(alias.name)
     
-    def visit_While(self, node: ast.While) -> None:
-        """Visit while loop."""
-        self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+    def _record_import_from(self, node: ast.ImportFrom) -> None:
+        """Record from-import statement."""
+        if node.module:
+            self.imports.add(node.module)
     
-    def visit_For(self, node: ast.For) -> None:
-        """Visit for loop."""
-        self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
-    
-    def visit_Try(self, node: ast.Try) -> None:
-        """Visit try statement."""
-        self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting_depth = max(self.max_nesting_depth, self.nesting_depth)
-        
-        self.generic_visit(node)
-        self.nesting_depth -= 1
-    
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
-        """Visit except handler."""
-        self.complexity += 1
-        self.generic_visit(node)
+    # Per-type bookkeeping run before descending into a node
+    _RECORDERS = {
+        ast.FunctionDef: _record_function,
+        ast.AsyncFunctionDef: _record_any_function,
+        ast.ClassDef: _record_class,
+        ast.Import: _record_import,
+        ast.ImportFrom: _record_import_from
+    }
 
 
 class SecurityAnalyzer:
@@ -197,26 +338,41 @@ class SecurityAnalyzer:
     def __init__(self):
         self.vulnerabilities = []
     
-    def analyze_file(self, file_path: Path, content: str) -> List[Dict[str, Any]]:
+    def analyze_file(self, ctx: FileContext) -> List[Dict[str, Any]]:
         """
         Analyze file for security issues.
         
         Args:
-            file_path: Path to the file
-            content: File content
+            ctx: Content of the file to analyze
         
         Returns:
             List of security issues
         """
         issues = []
-        lines = content.split('\n')
+        content = ctx.content
+        
+        folded = content.casefold()
+        if not any(hint in folded for hint in SECURITY_HINTS):
+            return issues
         
-        for i, line in enumerate(lines, 1):
+        line_starts = ctx.line_starts
+        position = 0
+        
+        # One scan over the whole file finds the next line with any hit; only
+        # that line is re-checked pattern by pattern to keep per-line semantics
+        while True:
+            match = SECURITY_REGEX.search(content, position)
+            if match is None:
+                break
+            index = bisect_right(line_starts, match.start()) - 1
+            line = ctx.lines[index]
+            position = line_starts[index] + len(line) + 1
+            
             for pattern, message in SECURITY_PATTERNS:
-                if re.search(pattern, line, re.IGNORECASE):
+                if pattern.search(line):
                     issues.append({
                         'type': 'security',
-                        'line': i,
+                        'line': index + 1,
                         'severity': 'high',
                         'message': message,
                         'code': line.strip()
@@ -224,47 +380,6 @@ class SecurityAnalyzer:
         
         return issues
 
-
-class DependencyAnalyzer:
-    """Dependency analysis."""
-    
-    def __init__(self):
-        self.imports = defaultdict(set)
-        self.modules = set()
-    
-    def analyze_file(self, file_path: Path, content: str) -> Dict[str, Any]:
-        """
-        Analyze file dependencies.
-        
-        Args:
-            file_path: Path to the file
-            content: File content
-        
-        Returns:
-            Dependency analysis results
-        """
-        try:
-            tree = ast.parse(content, str(file_path))
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        self.imports[str(file_path)].add(alias.name)
-                        self.modules.add(alias.name)
-                
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        self.imports[str(file_path)].add(node.module)
-                        self.modules.add(node.module)
-        
-        except SyntaxError:
-            pass
-        
-        return {
-            'imports': list(self.imports[str(file_path)]),
-            'total_modules': len(self.modules)
-        }
-
 #######################################################################################################################
 # Helper Functions
 #######################################################################################################################
@@ -274,114 +389,154 @@ def find_python_files(directory: Path, exclude_patterns: List[str] = None) -> Li
     
     Args:
         directory: Directory to search
-        exclude_patterns: Patterns to exclude
+        exclude_patterns: Directory names to exclude (default: EXCLUDED_DIR_NAMES)
     
     Returns:
         List of Python file paths
     """
-    if exclude_patterns is None:
-        exclude_patterns = ['__pycache__', '.venv', 'venv', '.git', 'build', 'dist']
+    exclude_dirs = EXCLUDED_DIR_NAMES if exclude_patterns is None else frozenset(exclude_patterns)
     
-    python_files = []
+    return list(_scan_python_files(str(directory), exclude_dirs))
+
+
+def _scan_python_files(directory: str, exclude_dirs: frozenset) -> Iterator[Path]:
+    """
+    Recursively yield Python files, pruning excluded directories.
     
-    for file_path in directory.rglob("*.py"):
-        # Skip excluded directories
-        skip_file = False
-        for pattern in exclude_patterns:
-            if pattern in str(file_path):
-                skip_file = True
-                break
-        
-        if not skip_file:
-            python_files.append(file_path)
+    Args:
+        directory: Directory to scan
+        exclude_dirs: Directory names to exclude
     
-    return python_files
+    Yields:
+        Python file paths
+    """
+    try:
+        entries = os.scandir(directory)
+    except PermissionError:
+        return  # Unreadable directories are skipped, as Path.rglob does
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    yield from _scan_python_files(entry.path, exclude_dirs)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield Path(entry.path)
 
 
-def analyze_complexity(file_path: Path, content: str) -> ComplexityMetrics:
+def load_file_context(file_path: Path) -> FileContext:
     """
-    Analyze code complexity for a file.
+    Read a Python file and split it into lines once for all analyses.
     
     Args:
         file_path: Path to the file
+    
+    Returns:
+        File context
+    
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    content = file_path.read_text(encoding='utf-8')
+    return FileContext(file_path, content, content.split('\n'))
+
+
+def parse_source(content: str) -> Optional[ast.AST]:
+    """
+    Parse file content into an AST shared by all analyzers.
+    
+    Args:
         content: File content
     
     Returns:
-        Complexity metrics
+        Parsed module, or None if the file has syntax errors
     """
     try:
-        tree = ast.parse(content, str(file_path))
-        analyzer = ComplexityAnalyzer()
-        analyzer.visit(tree)
-        
-        lines = [line for line in content.split('\n') if line.strip() and not line.strip().startswith('#')]
-        analyzer.lines_of_code = len(lines)
-        
-        avg_function_length = 0
-        if analyzer.function_lengths:
-            avg_function_length = sum(analyzer.function_lengths) / len(analyzer.function_lengths)
-        
-        return ComplexityMetrics(
-            cyclomatic_complexity=analyzer.complexity,
-            lines_of_code=analyzer.lines_of_code,
-            function_count=analyzer.function_count,
-            class_count=analyzer.class_count,
-            max_nesting_depth=analyzer.max_nesting_depth,
-            avg_function_length=avg_function_length
-        )
-    
+        return ast.parse(content)
     except SyntaxError:
+        return None
+
+
+def collect_metrics(tree: Optional[ast.AST]) -> Optional[ComplexityAnalyzer]:
+    """
+    Walk the AST once, collecting complexity, documentation and import data.
+    
+    Args:
+        tree: Parsed module, or None if the file has syntax errors
+    
+    Returns:
+        Visited analyzer, or None if there is no tree
+    """
+    if tree is None:
+        return None
+    
+    analyzer = ComplexityAnalyzer()
+    analyzer.visit(tree)
+    return analyzer
+
+
+@lru_cache(maxsize=SOURCE_METRICS_CACHE_SIZE)
+def collect_source_metrics(content: str) -> Optional[ComplexityAnalyzer]:
+    """
+    Parse and walk file content, reusing the result for identical content.
+    
+    Files with the same text (empty __init__.py files, generated stubs) are
+    parsed once per process, so the returned analyzer is shared and must
+    be treated as read-only.
+    
+    Args:
+        content: File content
+    
+    Returns:
+        Visited analyzer, or None if the file has syntax errors
+    """
+    return collect_metrics(parse_source(content))
+
+
+def analyze_complexity(analyzer: Optional[ComplexityAnalyzer], lines: List[str]) -> ComplexityMetrics:
+    """
+    Analyze code complexity for a file.
+    
+    Args:
+        analyzer: Visited analyzer, or None if the file has syntax errors
+        lines: File lines
+    
+    Returns:
+        Complexity metrics
+    """
+    if analyzer is None:
         return ComplexityMetrics(0, 0, 0, 0, 0, 0.0)
+    
+    lines_of_code = sum(
+        1 for stripped in map(str.strip, lines) if stripped and not stripped.startswith('#')
+    )
+    
+    avg_function_length = 0
+    if analyzer.function_lengths:
+        avg_function_length = sum(analyzer.function_lengths) / len(analyzer.function_lengths)
+    
+    return ComplexityMetrics(
+        cyclomatic_complexity=analyzer.complexity,
+        lines_of_code=lines_of_code,
+        function_count=analyzer.function_count,
+        class_count=analyzer.class_count,
+        max_nesting_depth=analyzer.max_nesting_depth,
+        avg_function_length=avg_function_length
+    )
 
 
-def analyze_documentation(file_path: Path, content: str) -> Dict[str, Any]:
+def analyze_documentation(analyzer: Optional[ComplexityAnalyzer]) -> Dict[str, Any]:
     """
     Analyze documentation coverage.
     
     Args:
-        file_path: Path to the file
-        content: File content
+        analyzer: Visited analyzer, or None if the file has syntax errors
     
     Returns:
         Documentation analysis results
     """
-    try:
-        tree = ast.parse(content, str(file_path))
-        
-        functions_with_docstrings = 0
-        total_functions = 0
-        classes_with_docstrings = 0
-        total_classes = 0
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                total_functions += 1
-                if ast.get_docstring(node):
-                    functions_with_docstrings += 1
-            
-            elif isinstance(node, ast.ClassDef):
-                total_classes += 1
-                if ast.get_docstring(node):
-                    classes_with_docstrings += 1
-        
-        function_coverage = 0
-        if total_functions > 0:
-            function_coverage = (functions_with_docstrings / total_functions) * 100
-        
-        class_coverage = 0
-        if total_classes > 0:
-            class_coverage = (classes_with_docstrings / total_classes) * 100
-        
-        return {
-            'function_docstring_coverage': function_coverage,
-            'class_docstring_coverage': class_coverage,
-            'total_functions': total_functions,
-            'total_classes': total_classes,
-            'documented_functions': functions_with_docstrings,
-            'documented_classes': classes_with_docstrings
-        }
-    
-    except SyntaxError:
+    if analyzer is None:
         return {
             'function_docstring_coverage': 0,
             'class_docstring_coverage': 0,
@@ -390,24 +545,59 @@ def analyze_documentation(file_path: Path, content: str) -> Dict[str, Any]:
             'documented_functions': 0,
             'documented_classes': 0
         }
+    
+    function_coverage = 0
+    if analyzer.total_functions > 0:
+        function_coverage = (analyzer.documented_functions / analyzer.total_functions) * 100
+    
+    class_coverage = 0
+    if analyzer.total_classes > 0:
+        class_coverage = (analyzer.documented_classes / analyzer.total_classes) * 100
+    
+    return {
+        'function_docstring_coverage': function_coverage,
+        'class_docstring_coverage': class_coverage,
+        'total_functions': analyzer.total_functions,
+        'total_classes': analyzer.total_classes,
+        'documented_functions': analyzer.documented_functions,
+        'documented_classes': analyzer.documented_classes
+    }
 
 
-def analyze_file(file_path: Path) -> AnalysisResult:
+def analyze_dependencies(analyzer: Optional[ComplexityAnalyzer]) -> Dict[str, Any]:
+    """
+    Analyze file dependencies.
+    
+    Args:
+        analyzer: Visited analyzer, or None if the file has syntax errors
+    
+    Returns:
+        Dependency analysis results
+    """
+    imports = sorted(analyzer.imports) if analyzer is not None else []
+    
+    return {
+        'imports': imports,
+        'total_modules': len(imports)
+    }
+
+
+def analyze_file(file_path: Path, wanted: Analyses = Analyses.ALL) -> AnalysisResult:
     """
     Perform comprehensive analysis of a Python file.
     
     Args:
         file_path: Path to the file to analyze
+        wanted: Sub-analyses to run; metrics only hold the groups that ran
     
     Returns:
         Analysis results
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        ctx = load_file_context(file_path)
     except Exception as e:
         return AnalysisResult(
-            file_path=str(file_path),
+            file_path=file_path,
             issues=[{'type': 'error', 'message': f'Cannot read file: {e}'}],
             metrics={},
             suggestions=[]
@@ -415,45 +605,80 @@ def analyze_file(file_path: Path) -> AnalysisResult:
     
     issues = []
     suggestions = []
+    metrics = {}
+    
+    # Parse and walk once; every AST-based analysis below reads from this analyzer
+    if wanted & (Analyses.COMPLEXITY | Analyses.DOCUMENTATION | Analyses.DEPENDENCIES):
+        analyzer = collect_source_metrics(ctx.content)
+    
+    if wanted & Analyses.COMPLEXITY:
+        _add_complexity_analysis(analyzer, ctx, issues, suggestions, metrics)
+    
+    if wanted & Analyses.SECURITY:
+        issues.extend(SecurityAnalyzer().analyze_file(ctx))
+    
+    if wanted & Analyses.DOCUMENTATION:
+        _add_documentation_analysis(analyzer, issues, suggestions, metrics)
     
-    # Complexity analysis
-    complexity = analyze_complexity(file_path, content)
+    if wanted & Analyses.DEPENDENCIES:
+        metrics['dependencies'] = analyze_dependencies(analyzer)
+    
+    return AnalysisResult(
+        file_path=file_path,
+        issues=issues,
+        metrics=metrics,
+        suggestions=suggestions
+    )
+
+
+def _add_complexity_analysis(analyzer: Optional[ComplexityAnalyzer], ctx: FileContext,
+                             issues: List[Dict[str, Any]], suggestions: List[str],
+                             metrics: Dict[str, Any]) -> None:
+    """Add complexity metrics and threshold issues to a file's results."""
+    complexity_metrics = analyze_complexity(analyzer, ctx.lines)
     
     # Check complexity thresholds
-    if complexity.cyclomatic_complexity > COMPLEXITY_THRESHOLDS['cyclomatic_complexity']:
+    if complexity_metrics.cyclomatic_complexity > COMPLEXITY_THRESHOLDS['cyclomatic_complexity']:
         issues.append({
             'type': 'complexity',
             'severity': 'warning',
-            'message': f'High cyclomatic complexity: {complexity.cyclomatic_complexity}',
+            'message': f'High cyclomatic complexity: {complexity_metrics.cyclomatic_complexity}',
             'threshold': COMPLEXITY_THRESHOLDS['cyclomatic_complexity']
         })
-        suggestions.append('Consider breaking down complex functions into smaller ones')
+        suggestions.append(SUGGESTIONS['complexity'])
     
-    if complexity.max_nesting_depth > COMPLEXITY_THRESHOLDS['nesting_depth']:
+    if complexity_metrics.max_nesting_depth > COMPLEXITY_THRESHOLDS['nesting_depth']:
         issues.append({
             'type': 'complexity',
             'severity': 'warning',
-            'message': f'Deep nesting detected: {complexity.max_nesting_depth} levels',
+            'message': f'Deep nesting detected: {complexity_metrics.max_nesting_depth} levels',
             'threshold': COMPLEXITY_THRESHOLDS['nesting_depth']
         })
-        suggestions.append('Reduce nesting depth by extracting functions or using early returns')
+        suggestions.append(SUGGESTIONS['nesting'])
     
-    if complexity.avg_function_length > COMPLEXITY_THRESHOLDS['function_lines']:
+    if complexity_metrics.avg_function_length > COMPLEXITY_THRESHOLDS['function_lines']:
         issues.append({
             'type': 'complexity',
             'severity': 'info',
-            'message': f'Long functions detected: avg {complexity.avg_function_length:.1f} lines',
+            'message': f'Long functions detected: avg {complexity_metrics.avg_function_length:.1f} lines',
             'threshold': COMPLEXITY_THRESHOLDS['function_lines']
         })
-        suggestions.append('Consider breaking long functions into smaller, focused functions')
-    
-    # Security analysis
-    security_analyzer = SecurityAnalyzer()
-    security_issues = security_analyzer.analyze_file(file_path, content)
-    issues.extend(security_issues)
+        suggestions.append(SUGGESTIONS['function_length'])
     
-    # Documentation analysis
-    doc_analysis = analyze_documentation(file_path, content)
+    metrics['complexity'] = {
+        'cyclomatic_complexity': complexity_metrics.cyclomatic_complexity,
+        'lines_of_code': complexity_metrics.lines_of_code,
+        'function_count': complexity_metrics.function_count,
+        'class_count': complexity_metrics.class_count,
+        'max_nesting_depth': complexity_metrics.max_nesting_depth,
+        'avg_function_length': complexity_metrics.avg_function_length
+    }
+
+
+def _add_documentation_analysis(analyzer: Optional[ComplexityAnalyzer], issues: List[Dict[str, Any]],
+                                suggestions: List[str], metrics: Dict[str, Any]) -> None:
+    """Add docstring coverage metrics and issues to a file's results."""
+    doc_analysis = analyze_documentation(analyzer)
     
     if doc_analysis['function_docstring_coverage'] < 50:
         issues.append({
@@ -461,7 +686,7 @@ def analyze_file(file_path: Path) -> AnalysisResult:
             'severity': 'info',
             'message': f'Low function documentation coverage: {doc_analysis["function_docstring_coverage"]:.1f}%'
         })
-        suggestions.append('Add docstrings to functions for better documentation')
+        suggestions.append(SUGGESTIONS['function_docs'])
     
     if doc_analysis['class_docstring_coverage'] < 70:
         issues.append({
@@ -469,32 +694,203 @@ def analyze_file(file_path: Path) -> AnalysisResult:
             'severity': 'info',
             'message': f'Low class documentation coverage: {doc_analysis["class_docstring_coverage"]:.1f}%'
         })
-        suggestions.append('Add docstrings to classes for better documentation')
-    
-    # Dependency analysis
-    dep_analyzer = DependencyAnalyzer()
-    dep_analysis = dep_analyzer.analyze_file(file_path, content)
-    
-    # Combine metrics
-    metrics = {
-        'complexity': {
-            'cyclomatic_complexity': complexity.cyclomatic_complexity,
-            'lines_of_code': complexity.lines_of_code,
-            'function_count': complexity.function_count,
-            'class_count': complexity.class_count,
-            'max_nesting_depth': complexity.max_nesting_depth,
-            'avg_function_length': complexity.avg_function_length
-        },
-        'documentation': doc_analysis,
-        'dependencies': dep_analysis
-    }
+        suggestions.append(SUGGESTIONS['class_docs'])
     
-    return AnalysisResult(
-        file_path=str(file_path),
-        issues=issues,
-        metrics=metrics,
-        suggestions=suggestions
-    )
+    metrics['documentation'] = doc_analysis
+
+
+def measure_file_complexity(file_path: Path) -> Optional[ComplexityMetrics]:
+    """
+    Read a file and compute its complexity metrics.
+    
+    Args:
+        file_path: Path to the file
+    
+    Returns:
+        Complexity metrics, or None if the file cannot be read or analyzed
+    """
+    try:
+        ctx = load_file_context(file_path)
+        return analyze_complexity(collect_source_metrics(ctx.content), ctx.lines)
+    except Exception:
+        return None
+
+
+def map_files(worker: Callable[[Path], ResultT], files: List[Path], jobs: int = 1) -> Iterator[ResultT]:
+    """
+    Apply a per-file worker, spreading the work across processes when jobs > 1.
+    
+    Args:
+        worker: Module-level function taking a file path
+        files: Python files to process
+        jobs: Number of worker processes
+    
+    Returns:
+        Iterator of worker results, in input order
+    """
+    if jobs <= 1 or len(files) <= 1:
+        return (worker(file_path) for file_path in files)
+    
+    return _map_files_parallel(worker, files, jobs)
+
+
+def _map_files_parallel(worker: Callable[[Path], ResultT], files: List[Path], jobs: int) -> Iterator[ResultT]:
+    """Run a per-file worker in a process pool, yielding results in input order."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(worker, files, chunksize=ANALYSIS_CHUNK_SIZE)
+
+
+def load_analysis_cache(cache_dir: Path) -> Dict[str, Any]:
+    """
+    Load cached analysis results written by a previous run.
+    
+    Args:
+        cache_dir: Directory holding the cache file
+    
+    Returns:
+        Mapping of absolute file path to cache entry (empty if unusable)
+    """
+    try:
+        data = json.loads((cache_dir / CACHE_FILE_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    
+    # Results from another tool version may use different rules
+    if not isinstance(data, dict) or data.get("version") != TOOL_VERSION:
+        return {}
+    
+    return data.get("files", {})
+
+
+def save_analysis_cache(cache_dir: Path, entries: Dict[str, Any]) -> None:
+    """
+    Atomically write analysis results for the next run.
+    
+    Args:
+        cache_dir: Directory holding the cache file
+        entries: Mapping of absolute file path to cache entry
+    """
+    cache_path = cache_dir / CACHE_FILE_NAME
+    tmp_path = cache_dir / f"{CACHE_FILE_NAME}.tmp"
+    
+    try:
+        tmp_path.write_text(json.dumps({"version": TOOL_VERSION, "files": entries}), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best effort (e.g. read-only checkout)
+
+
+def _file_cache_key(file_path: Path) -> Optional[str]:
+    """Return the (mtime, size) cache key of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def iter_cached_analysis_results(files: List[Path], cache: Dict[str, Any], jobs: int = 1,
+                                 wanted: Analyses = Analyses.ALL) -> Iterator[AnalysisResult]:
+    """
+    Analyze files, reusing cached results for files whose (mtime, size) is unchanged.
+    
+    New results are written back into cache, and entries for files that no
+    longer exist are dropped from it.
+    
+    Args:
+        files: Python files to analyze
+        cache: Cache entries from load_analysis_cache (updated in place)
+        jobs: Number of worker processes
+        wanted: Sub-analyses to run; cached results must have run the same set
+    
+    Returns:
+        Iterator of analysis results, in input order
+    """
+    abs_paths = [os.path.abspath(file_path) for file_path in files]
+    cache_keys = []
+    stale_files = []
+    
+    def is_fresh(entry: Optional[Dict[str, Any]], cache_key: Optional[str]) -> bool:
+        return (cache_key is not None and entry is not None
+                and entry.get("key") == cache_key and entry.get("analyses") == int(wanted))
+    
+    for file_path, abs_path in zip(files, abs_paths):
+        cache_key = _file_cache_key(file_path)
+        if not is_fresh(cache.get(abs_path), cache_key):
+            stale_files.append(file_path)
+        cache_keys.append(cache_key)
+    
+    # Forget deleted files; entries outside this run's file list are only stat'ed
+    checked_paths = set(abs_paths)
+    for cached_path in [path for path in cache if path not in checked_paths and not os.path.exists(path)]:
+        del cache[cached_path]
+    
+    fresh_results = map_files(partial(analyze_file, wanted=wanted), stale_files, jobs)
+    
+    for file_path, abs_path, cache_key in zip(files, abs_paths, cache_keys):
+        entry = cache.get(abs_path)
+        
+        if is_fresh(entry, cache_key):
+            # The same file may be reached through a different relative path;
+            # suggestions are interned so repeated texts share one object
+            cached = entry["result"]
+            yield AnalysisResult(
+                file_path=file_path,
+                issues=cached["issues"],
+                metrics=cached["metrics"],
+                suggestions=[sys.intern(suggestion) for suggestion in cached["suggestions"]]
+            )
+            continue
+        
+        result = next(fresh_results)
+        if cache_key is not None:
+            cache[abs_path] = {
+                "key": cache_key,
+                "analyses": int(wanted),
+                "result": {
+                    "issues": result.issues,
+                    "metrics": result.metrics,
+                    "suggestions": result.suggestions
+                }
+            }
+        yield result
+
+
+def iter_cached_complexity_metrics(files: List[Path], cache: Dict[str, Any],
+                                   jobs: int = 1) -> Iterator[Optional[ComplexityMetrics]]:
+    """
+    Measure file complexity, reusing metrics cached by a previous analyze run.
+    
+    Files whose (mtime, size) is unchanged since analyze last saw them are
+    neither read nor parsed. The cache is only read, since these results
+    lack the issues and suggestions analyze stores.
+    
+    Args:
+        files: Python files to measure
+        cache: Cache entries from load_analysis_cache
+        jobs: Number of worker processes
+    
+    Returns:
+        Iterator of complexity metrics (None if a file cannot be analyzed), in input order
+    """
+    cached_metrics = []
+    stale_files = []
+    
+    for file_path in files:
+        metrics = None
+        entry = cache.get(os.path.abspath(file_path))
+        if entry is not None and entry.get("key") == _file_cache_key(file_path):
+            metrics = entry["result"]["metrics"].get("complexity")
+        
+        if metrics is None:
+            stale_files.append(file_path)
+        cached_metrics.append(metrics)
+    
+    fresh_metrics = map_files(measure_file_complexity, stale_files, jobs)
+    
+    for metrics in cached_metrics:
+        yield ComplexityMetrics(**metrics) if metrics is not None else next(fresh_metrics)
 
 #######################################################################################################################
 # Main CLI Commands
@@ -507,7 +903,7 @@ def cli():
 
 
 @cli.command()
-@click.argument('path', type=click.Path(exists=True))
+@click.argument('path', type=click.Path(exists=True, path_type=Path))
 @click.option('--output', '-o',
               type=click.Choice(['text', 'json', 'html']),
               default='text',
@@ -519,7 +915,17 @@ def cli():
 @click.option('--report-file',
               type=click.Path(),
               help='Save report to file')
-def analyze(path: str, output: str, min_severity: str, report_file: Optional[str]) -> None:
+@click.option('--jobs', '-j',
+              type=click.IntRange(min=1),
+              default=os.cpu_count() or 1,
+              show_default=True,
+              help='Number of worker processes')
+@click.option('--no-cache', is_flag=True, help=f'Ignore and do not update {CACHE_FILE_NAME}')
+@click.option('--no-security', is_flag=True, help='Skip security pattern scanning')
+@click.option('--no-docs', is_flag=True, help='Skip documentation coverage analysis')
+@click.option('--no-deps', is_flag=True, help='Skip dependency analysis')
+def analyze(path: Path, output: str, min_severity: str, report_file: Optional[str], jobs: int,
+            no_cache: bool, no_security: bool, no_docs: bool, no_deps: bool) -> None:
     """
     Perform comprehensive static analysis of Python code.
     
@@ -535,13 +941,11 @@ def analyze(path: str, output: str, min_severity: str, report_file: Optional[str
             console.print("=" * 70, style="blue")
             console.print()
         
-        path_obj = Path(path)
-        
         # Find Python files
-        if path_obj.is_file():
-            files_to_analyze = [path_obj]
+        if path.is_file():
+            files_to_analyze = [path]
         else:
-            files_to_analyze = find_python_files(path_obj)
+            files_to_analyze = find_python_files(path)
         
         if not files_to_analyze:
             console.print("❌ No Python files found", style="red")
@@ -553,22 +957,37 @@ def analyze(path: str, output: str, min_severity: str, report_file: Optional[str
         with Progress() as progress:
             task = progress.add_task("Analyzing files...", total=len(files_to_analyze))
             
-            for file_path in files_to_analyze:
-                result = analyze_file(file_path)
+            cache_dir = path if path.is_dir() else path.parent
+            
+            wanted = Analyses.ALL
+            if no_security:
+                wanted &= ~Analyses.SECURITY
+            if no_docs:
+                wanted &= ~Analyses.DOCUMENTATION
+            if no_deps:
+                wanted &= ~Analyses.DEPENDENCIES
+            
+            if no_cache:
+                file_results = map_files(partial(analyze_file, wanted=wanted), files_to_analyze, jobs)
+            else:
+                cache = load_analysis_cache(cache_dir)
+                file_results = iter_cached_analysis_results(files_to_analyze, cache, jobs, wanted)
+            
+            for result in file_results:
                 results.append(result)
                 progress.update(task, advance=1)
+            
+            if not no_cache:
+                save_analysis_cache(cache_dir, cache)
         
         # Generate report
         if output == 'text':
             generate_text_report(results, min_severity)
         elif output == 'json':
             report_data = generate_json_report(results, min_severity)
+            write_json_report(report_data, report_file)
             if report_file:
-                with open(report_file, 'w') as f:
-                    json.dump(report_data, f, indent=2)
                 console.print(f"📄 Report saved to {report_file}", style="green")
-            else:
-                print(json.dumps(report_data, indent=2))
         elif output == 'html':
             if not report_file:
                 report_file = 'analysis_report.html'
@@ -581,21 +1000,25 @@ def analyze(path: str, output: str, min_severity: str, report_file: Optional[str
 
 
 @cli.command()
-@click.argument('path', type=click.Path(exists=True))
-def complexity(path: str) -> None:
+@click.argument('path', type=click.Path(exists=True, path_type=Path))
+@click.option('--jobs', '-j',
+              type=click.IntRange(min=1),
+              default=os.cpu_count() or 1,
+              show_default=True,
+              help='Number of worker processes')
+@click.option('--no-cache', is_flag=True, help=f'Ignore results cached in {CACHE_FILE_NAME} by analyze')
+def complexity(path: Path, jobs: int, no_cache: bool) -> None:
     """
     Show complexity metrics for Python code.
     
     PATH can be a file or directory to analyze.
     """
     try:
-        path_obj = Path(path)
-        
         # Find Python files
-        if path_obj.is_file():
-            files_to_analyze = [path_obj]
+        if path.is_file():
+            files_to_analyze = [path]
         else:
-            files_to_analyze = find_python_files(path_obj)
+            files_to_analyze = find_python_files(path)
         
         if not files_to_analyze:
             console.print("❌ No Python files found", style="red")
@@ -619,37 +1042,38 @@ def complexity(path: str) -> None:
         total_functions = 0
         total_classes = 0
         
-        for file_path in files_to_analyze:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                complexity_metrics = analyze_complexity(file_path, content)
-                
-                # Color coding based on complexity
-                complexity_style = "green"
-                if complexity_metrics.cyclomatic_complexity > 20:
-                    complexity_style = "red"
-                elif complexity_metrics.cyclomatic_complexity > 10:
-                    complexity_style = "yellow"
-                
-                table.add_row(
-                    str(file_path.name),
-                    str(complexity_metrics.cyclomatic_complexity),
-                    str(complexity_metrics.lines_of_code),
-                    str(complexity_metrics.function_count),
-                    str(complexity_metrics.class_count),
-                    str(complexity_metrics.max_nesting_depth),
-                    style=complexity_style
-                )
-                
-                total_complexity += complexity_metrics.cyclomatic_complexity
-                total_loc += complexity_metrics.lines_of_code
-                total_functions += complexity_metrics.function_count
-                total_classes += complexity_metrics.class_count
-                
-            except Exception:
-                table.add_row(str(file_path.name), "Error", "-", "-", "-", "-", style="red")
+        if no_cache:
+            file_metrics = map_files(measure_file_complexity, files_to_analyze, jobs)
+        else:
+            cache = load_analysis_cache(path if path.is_dir() else path.parent)
+            file_metrics = iter_cached_complexity_metrics(files_to_analyze, cache, jobs)
+        
+        for file_path, complexity_metrics in zip(files_to_analyze, file_metrics):
+            if complexity_metrics is None:
+                table.add_row(file_path.name, "Error", "-", "-", "-", "-", style="red")
+                continue
+            
+            # Color coding based on complexity
+            complexity_style = "green"
+            if complexity_metrics.cyclomatic_complexity > 20:
+                complexity_style = "red"
+            elif complexity_metrics.cyclomatic_complexity > 10:
+                complexity_style = "yellow"
+            
+            table.add_row(
+                file_path.name,
+                str(complexity_metrics.cyclomatic_complexity),
+                str(complexity_metrics.lines_of_code),
+                str(complexity_metrics.function_count),
+                str(complexity_metrics.class_count),
+                str(complexity_metrics.max_nesting_depth),
+                style=complexity_style
+            )
+            
+            total_complexity += complexity_metrics.cyclomatic_complexity
+            total_loc += complexity_metrics.lines_of_code
+            total_functions += complexity_metrics.function_count
+            total_classes += complexity_metrics.class_count
         
         # Add totals row
         table.add_row(
@@ -681,10 +1105,28 @@ def complexity(path: str) -> None:
         sys.exit(1)
 
 
+def filter_issues_by_severity(results: List[AnalysisResult], min_severity: str) -> List[List[Dict[str, Any]]]:
+    """
+    Filter each result's issues by severity once, for reuse across a whole report.
+    
+    Args:
+        results: Analysis results
+        min_severity: Minimum severity level to keep
+    
+    Returns:
+        Filtered issue list per result, in the same order as results
+    """
+    min_level = SEVERITY_LEVELS[min_severity]
+    
+    return [
+        [issue for issue in result.issues if SEVERITY_LEVELS.get(issue.get('severity', 'info'), 1) >= min_level]
+        for result in results
+    ]
+
+
 def generate_text_report(results: List[AnalysisResult], min_severity: str) -> None:
     """Generate text report."""
-    severity_levels = {'info': 1, 'warning': 2, 'error': 3}
-    min_level = severity_levels[min_severity]
+    filtered_by_result = filter_issues_by_severity(results, min_severity)
     
     total_issues = 0
     total_suggestions = 0
@@ -700,20 +1142,15 @@ def generate_text_report(results: List[AnalysisResult], min_severity: str) -> No
     summary_table.add_column("LOC", width=8)
     summary_table.add_column("Doc Coverage", width=12)
     
-    for result in results:
-        filtered_issues = [
-            issue for issue in result.issues
-            if severity_levels.get(issue.get('severity', 'info'), 1) >= min_level
-        ]
-        
-        complexity = result.metrics.get('complexity', {}).get('cyclomatic_complexity', 0)
+    for result, filtered_issues in zip(results, filtered_by_result):
+        cyclomatic_complexity = result.metrics.get('complexity', {}).get('cyclomatic_complexity', 0)
         loc = result.metrics.get('complexity', {}).get('lines_of_code', 0)
         doc_coverage = result.metrics.get('documentation', {}).get('function_docstring_coverage', 0)
         
         summary_table.add_row(
-            Path(result.file_path).name,
+            result.file_path.name,
             str(len(filtered_issues)),
-            str(complexity),
+            str(cyclomatic_complexity),
             str(loc),
             f"{doc_coverage:.1f}%"
         )
@@ -729,14 +1166,9 @@ def generate_text_report(results: List[AnalysisResult], min_severity: str) -> No
         console.print(f"🔍 Detailed Issues ({total_issues} total)", style="bold yellow")
         console.print("-" * 50, style="yellow")
         
-        for result in results:
-            file_issues = [
-                issue for issue in result.issues
-                if severity_levels.get(issue.get('severity', 'info'), 1) >= min_level
-            ]
-            
+        for result, file_issues in zip(results, filtered_by_result):
             if file_issues:
-                console.print(f"\n📄 {Path(result.file_path).name}", style="bold cyan")
+                console.print(f"\n📄 {result.file_path.name}", style="bold cyan")
                 
                 for issue in file_issues:
                     severity = issue.get('severity', 'info')
@@ -759,10 +1191,7 @@ def generate_text_report(results: List[AnalysisResult], min_severity: str) -> No
             all_suggestions.extend(result.suggestions)
         
         # Remove duplicates while preserving order
-        unique_suggestions = []
-        for suggestion in all_suggestions:
-            if suggestion not in unique_suggestions:
-                unique_suggestions.append(suggestion)
+        unique_suggestions = list(dict.fromkeys(all_suggestions))
         
         for i, suggestion in enumerate(unique_suggestions, 1):
             console.print(f"  {i}. {suggestion}")
@@ -772,8 +1201,7 @@ def generate_text_report(results: List[AnalysisResult], min_severity: str) -> No
 
 def generate_json_report(results: List[AnalysisResult], min_severity: str) -> Dict[str, Any]:
     """Generate JSON report."""
-    severity_levels = {'info': 1, 'warning': 2, 'error': 3}
-    min_level = severity_levels[min_severity]
+    filtered_by_result = filter_issues_by_severity(results, min_severity)
     
     report_data = {
         'metadata': {
@@ -784,20 +1212,15 @@ def generate_json_report(results: List[AnalysisResult], min_severity: str) -> Di
         },
         'summary': {
             'total_files': len(results),
-            'total_issues': sum(len([i for i in r.issues if severity_levels.get(i.get('severity', 'info'), 1) >= min_level]) for r in results),
+            'total_issues': sum(len(filtered_issues) for filtered_issues in filtered_by_result),
             'total_suggestions': sum(len(r.suggestions) for r in results)
         },
         'files': []
     }
     
-    for result in results:
-        filtered_issues = [
-            issue for issue in result.issues
-            if severity_levels.get(issue.get('severity', 'info'), 1) >= min_level
-        ]
-        
+    for result, filtered_issues in zip(results, filtered_by_result):
         file_data = {
-            'path': result.file_path,
+            'path': str(result.file_path),
             'issues': filtered_issues,
             'metrics': result.metrics,
             'suggestions': result.suggestions
@@ -808,60 +1231,107 @@ def generate_json_report(results: List[AnalysisResult], min_severity: str) -> Di
     return report_data
 
 
-def generate_html_report(results: List[AnalysisResult], min_severity: str, output_file: str) -> None:
-    """Generate HTML report."""
-    # Basic HTML template - in a real implementation, you'd use a proper template engine
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>IOE Static Analysis Report</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background: #2196F3; color: white; padding: 20px; }}
-            .summary {{ background: #f5f5f5; padding: 15px; margin: 20px 0; }}
-            .file {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; }}
-            .issue {{ margin: 5px 0; padding: 5px; }}
-            .error {{ background: #ffebee; border-left: 4px solid #f44336; }}
-            .warning {{ background: #fff3e0; border-left: 4px solid #ff9800; }}
-            .info {{ background: #e3f2fd; border-left: 4px solid #2196f3; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>{TOOL_NAME} Report</h1>
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="summary">
-            <h2>Summary</h2>
-            <p>Total files analyzed: {len(results)}</p>
-            <p>Minimum severity: {min_severity}</p>
-        </div>
-        
-        <h2>Files</h2>
+def write_json_report(report: Dict[str, Any], report_file: Optional[str] = None) -> None:
     """
+    Write a JSON report with 2-space indentation to a file or stdout.
     
-    for result in results:
-        html_content += f"""
-        <div class="file">
-            <h3>{Path(result.file_path).name}</h3>
-        """
+    With orjson the report is encoded straight to UTF-8 bytes and written to
+    the file or the binary stdout buffer; otherwise the json module is used.
+    
+    Args:
+        report: JSON-serializable report
+        report_file: Output file path, or None for stdout
+    """
+    if report_file:
+        if ORJSON_AVAILABLE:
+            Path(report_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
+        return
+    
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    
+    if ORJSON_AVAILABLE and stdout_buffer is not None:
+        sys.stdout.flush()  # Keep earlier text output ahead of the raw bytes
+        stdout_buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        stdout_buffer.flush()
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def _issue_severity(issue: Dict[str, Any]) -> str:
+    """Severity of an issue, defaulting to info."""
+    return issue.get('severity', 'info')
+
+
+def _issue_severity_order(issue: Dict[str, Any]) -> Tuple[int, str]:
+    """Sort key placing more severe issues first, with equal ranks grouped by name."""
+    severity = issue.get('severity', 'info')
+    return (-SEVERITY_LEVELS.get(severity, 1), severity)
+
+
+def _iter_html_report(results: List[AnalysisResult], min_severity: str) -> Iterator[str]:
+    """
+    Yield the HTML report fragment by fragment.
+    
+    Args:
+        results: Analysis results to render
+        min_severity: Minimum severity level of issues to include
+    
+    Returns:
+        Iterator over the report's string fragments, in document order
+    """
+    yield HTML_REPORT_HEAD
+    yield HTML_REPORT_SUMMARY_TEMPLATE % (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), len(results), min_severity)
+    
+    filtered_by_result = filter_issues_by_severity(results, min_severity)
+    
+    # Messages repeat heavily across files; each distinct message is escaped and formatted once
+    fragments: Dict[str, str] = {}
+    
+    for result, filtered_issues in zip(results, filtered_by_result):
+        yield HTML_FILE_TEMPLATE % result.file_path.name.translate(HTML_ESCAPE_TABLE)
         
-        for issue in result.issues:
-            severity = issue.get('severity', 'info')
-            message = issue.get('message', 'No message')
-            html_content += f'<div class="issue {severity}">{message}</div>'
+        # Most severe first; the severity class goes on one group div instead of every issue
+        ordered_issues = sorted(filtered_issues, key=_issue_severity_order)
+        for severity, group in groupby(ordered_issues, key=_issue_severity):
+            yield HTML_ISSUE_GROUP_TEMPLATE % severity
+            
+            for issue in group:
+                message = issue.get('message', 'No message')
+                fragment = fragments.get(message)
+                if fragment is None:
+                    fragment = fragments[message] = HTML_ISSUE_TEMPLATE % message.translate(HTML_ESCAPE_TABLE)
+                yield fragment
+            
+            yield "</div>"
         
-        html_content += "</div>"
+        yield "</div>"
     
-    html_content += """
-    </body>
-    </html>
+    yield HTML_REPORT_FOOT
+
+
+def generate_html_report(results: List[AnalysisResult], min_severity: str, output_file: str) -> None:
+    """
+    Generate HTML report, streaming fragments to the file instead of joining them in memory.
+    
+    An output_file ending in .gz is written as a gzip stream directly, without a plain copy.
+    
+    Args:
+        results: Analysis results
+        min_severity: Minimum severity level of issues to include
+        output_file: Report file path
     """
+    if output_file.endswith(GZIP_REPORT_SUFFIX):
+        # mtime=0 keeps the gzip header reproducible for identical reports
+        report_stream = gzip.GzipFile(output_file, 'wb', compresslevel=GZIP_REPORT_COMPRESS_LEVEL, mtime=0)
+    else:
+        # Binary mode bypasses TextIOWrapper; each fragment is UTF-8 encoded once on its way out
+        report_stream = open(output_file, 'wb', buffering=REPORT_WRITE_BUFFER_SIZE)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    with report_stream as f:
+        f.writelines(fragment.encode('utf-8') for fragment in _iter_html_report(results, min_severity))
 
 #######################################################################################################################
 # Main Execution